@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import logging
 import sys
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -66,6 +66,12 @@ class Settings(BaseSettings):
     anthropic_api_key: str = ""
     openai_api_key: str = ""
     google_gemini_api_key: str = ""
+    # Route non-urgent document compliance checks through the provider
+    # Batch API (50% cost, no RPM pressure) instead of per-upload calls.
+    llm_batch_mode: bool = False
+    # Cap on simultaneous in-flight LLM compliance calls per process; an
+    # upload burst beyond this waits instead of triggering provider 429s.
+    llm_max_concurrency: int = 32
 
     # --- Logging ---
     log_level: str = "INFO"
@@ -77,6 +83,11 @@ class Settings(BaseSettings):
         case_sensitive=False,
     )
 
+    @cached_property
+    def has_llm_keys(self) -> bool:
+        """True when at least one LLM provider API key is configured."""
+        return bool(self.anthropic_api_key or self.openai_api_key)
+
     def validate_production_cors(self) -> None:
         """P0-07: Block wildcard / localhost origins in production."""
         if self.api_env != "production":
@@ -0,0 +1,4 @@
+# Deps package — shared singleton dependencies for request handlers
+from .supabase import get_shared_supabase
+
+__all__ = ["get_shared_supabase"]
@@ -0,0 +1,40 @@
+"""Process-wide Supabase client shared across routers.
+
+Creating a supabase-py client per request re-runs TCP+TLS setup and
+allocates a fresh PostgREST session each time — the dominant latency
+component of every DB-bound handler. The client here is built once per
+process (lru_cache) on top of a shared HTTP/2 keep-alive transport, so
+all handlers multiplex one persistent connection pool.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from app.config import get_settings
+
+
+@lru_cache(maxsize=1)
+def _shared_httpx_client():  # noqa: ANN202
+    """Shared HTTP/2 keep-alive transport reused by every Supabase client."""
+    import httpx  # noqa: WPS433 -- lazy import
+
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        timeout=10,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_shared_supabase():  # noqa: ANN201
+    """Return the process-wide Supabase client (created on first use)."""
+    from supabase import create_client  # noqa: WPS433 -- lazy import
+    from supabase.client import ClientOptions  # noqa: WPS433 -- lazy import
+
+    settings = get_settings()
+    return create_client(
+        settings.supabase_url,
+        settings.supabase_service_role_key,
+        options=ClientOptions(httpx_client=_shared_httpx_client()),
+    )
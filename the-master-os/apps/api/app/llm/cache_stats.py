@@ -0,0 +1,27 @@
+"""Hit/miss counters for the LLM response caches.
+
+Each cache layer (business-plan exact / semantic, debate exact) records
+its lookups here; ``GET /orchestrate/metrics`` exposes the snapshot so
+cache effectiveness can be watched without log scraping.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+
+_hits: Counter[str] = Counter()
+_misses: Counter[str] = Counter()
+
+
+def record(cache: str, *, hit: bool) -> None:
+    """Count one lookup against the named cache layer."""
+    (_hits if hit else _misses)[cache] += 1
+
+
+def snapshot() -> dict[str, dict[str, int]]:
+    """Return per-cache hit/miss totals."""
+    caches = sorted(set(_hits) | set(_misses))
+    return {
+        cache: {"hits": _hits[cache], "misses": _misses[cache]}
+        for cache in caches
+    }
@@ -8,8 +8,11 @@ API key is configured.
 
 from __future__ import annotations
 
+import json
 import logging
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from fastapi import HTTPException, status
@@ -46,6 +49,19 @@ _MODEL_PRICING: dict[str, tuple[float, float]] = {
     "gemini-pro": (0.50, 1.50),
 }
 
+@lru_cache(maxsize=64)
+def _pricing_for(model: str) -> tuple[float, float] | None:
+    """Resolve a model's (input, output) price per 1 M tokens, memoized.
+
+    Also dedupes the unknown-model warning to once per model per process
+    instead of once per invocation.
+    """
+    pricing = _MODEL_PRICING.get(model)
+    if pricing is None:
+        logger.warning("No pricing data for model '%s'; cost reported as 0.0", model)
+    return pricing
+
+
 # Map of short model aliases → full Gemini model names
 _GEMINI_MODEL_MAP: dict[str, str] = {
     "gemini-pro": "gemini-2.5-pro",
@@ -63,6 +79,7 @@ class LLMResponse:
     output_tokens: int
     model: str
     cost: float
+    cached_tokens: int = 0
 
 
 @dataclass
@@ -151,6 +168,8 @@ class LLMClient:
         self,
         agent_row: dict[str, object],
         messages: list[dict[str, str]],
+        *,
+        json_schema: dict[str, object] | None = None,
     ) -> LLMResponse:
         """Invoke an LLM provider based on the agent's configuration.
 
@@ -159,6 +178,11 @@ class LLMClient:
                 ``model_provider``, ``model``, ``system_prompt``, and
                 ``parameters`` (dict with temperature / max_tokens / top_p).
             messages: List of ``{"role": ..., "content": ...}`` dicts.
+            json_schema: Optional JSON schema the provider must satisfy.
+                Anthropic is forced through a single tool call, OpenAI
+                through response_format — the returned ``content`` is then
+                guaranteed-parseable JSON with no code fences. Ignored for
+                Google.
 
         Returns:
             An ``LLMResponse`` with content, token counts, model, and cost.
@@ -180,6 +204,7 @@ class LLMClient:
                 temperature=temperature,
                 max_tokens=max_tokens,
                 top_p=top_p,
+                json_schema=json_schema,
             )
         if provider == "openai":
             return await self._invoke_openai(
@@ -189,6 +214,7 @@ class LLMClient:
                 temperature=temperature,
                 max_tokens=max_tokens,
                 top_p=top_p,
+                json_schema=json_schema,
             )
         if provider == "google":
             return await self._invoke_google(
@@ -209,6 +235,87 @@ class LLMClient:
             },
         )
 
+    async def invoke_stream(
+        self,
+        agent_row: dict[str, object],
+        messages: list[dict[str, str]],
+    ) -> AsyncIterator[dict[str, object]]:
+        """Stream an invocation as delta events (Anthropic only).
+
+        Yields ``{"type": "delta", "text": ...}`` per text chunk, then a
+        final ``{"type": "done", "response": LLMResponse}``. Providers
+        without a streaming path here fall back to one non-streaming
+        ``invoke`` whose content is emitted as a single delta, so callers
+        can consume either shape uniformly.
+        """
+        provider = str(agent_row.get("model_provider", ""))
+        if provider != "anthropic":
+            response = await self.invoke(agent_row, messages)
+            yield {"type": "delta", "text": response.content}
+            yield {"type": "done", "response": response}
+            return
+
+        model = str(agent_row.get("model", ""))
+        system_prompt = str(agent_row.get("system_prompt", ""))
+        params: dict[str, object] = dict(agent_row.get("parameters", {}) or {})  # type: ignore[arg-type]
+
+        temperature = float(params.get("temperature", 0.7))
+        max_tokens = int(params.get("max_tokens", 4096))
+        top_p = float(params.get("top_p", 1.0))
+
+        client = self._get_anthropic()
+
+        system_blocks: object = system_prompt
+        if system_prompt:
+            system_blocks = [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+
+        try:
+            async with client.messages.stream(
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                top_p=top_p,
+                system=system_blocks,  # type: ignore[arg-type]
+                messages=messages,  # type: ignore[arg-type]
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield {"type": "delta", "text": text}
+                final = await stream.get_final_message()
+        except Exception as exc:
+            logger.error("Anthropic streaming call failed: %s", exc, exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail={
+                    "code": "LLM_INVOCATION_FAILED",
+                    "message": f"Anthropic API error: {exc}",
+                },
+            ) from exc
+
+        content = "".join(
+            block.text for block in final.content if block.type == "text"
+        )
+        input_tokens = final.usage.input_tokens
+        output_tokens = final.usage.output_tokens
+        cached_tokens = int(getattr(final.usage, "cache_read_input_tokens", 0) or 0)
+
+        yield {
+            "type": "done",
+            "response": LLMResponse(
+                content=content,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                model=model,
+                cost=self._calculate_cost(model, input_tokens, output_tokens),
+                cached_tokens=cached_tokens,
+            ),
+        }
+
     # -- private provider calls ----------------------------------------
 
     async def _invoke_anthropic(
@@ -220,18 +327,47 @@ class LLMClient:
         temperature: float,
         max_tokens: int,
         top_p: float,
+        json_schema: dict[str, object] | None = None,
     ) -> LLMResponse:
         """Call Anthropic Messages API."""
         client = self._get_anthropic()
 
+        # Mark the system block for Anthropic prompt caching so repeated
+        # prefixes (system prompt + context) are served from cache.
+        system_blocks: object = system_prompt
+        if system_prompt:
+            system_blocks = [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+
+        # Schema enforcement: force a single tool call whose input must
+        # match the schema — the SDK-validated structured-output path.
+        extra: dict[str, object] = {}
+        if json_schema is not None:
+            extra = {
+                "tools": [
+                    {
+                        "name": "report",
+                        "description": "Report the structured result.",
+                        "input_schema": json_schema,
+                    }
+                ],
+                "tool_choice": {"type": "tool", "name": "report"},
+            }
+
         try:
             response = await client.messages.create(
                 model=model,
                 max_tokens=max_tokens,
                 temperature=temperature,
                 top_p=top_p,
-                system=system_prompt,
+                system=system_blocks,  # type: ignore[arg-type]
                 messages=messages,  # type: ignore[arg-type]
+                **extra,  # type: ignore[arg-type]
             )
         except Exception as exc:
             logger.error("Anthropic API call failed: %s", exc, exc_info=True)
@@ -245,11 +381,25 @@ class LLMClient:
 
         content = ""
         for block in response.content:
+            if json_schema is not None and block.type == "tool_use":
+                content = json.dumps(block.input, ensure_ascii=False)
+                break
             if block.type == "text":
                 content += block.text
 
         input_tokens = response.usage.input_tokens
         output_tokens = response.usage.output_tokens
+        cached_tokens = int(getattr(response.usage, "cache_read_input_tokens", 0) or 0)
+        cache_creation_tokens = int(
+            getattr(response.usage, "cache_creation_input_tokens", 0) or 0
+        )
+        if cached_tokens or cache_creation_tokens:
+            logger.debug(
+                "Anthropic prompt cache: model=%s read=%d created=%d",
+                model,
+                cached_tokens,
+                cache_creation_tokens,
+            )
         cost = self._calculate_cost(model, input_tokens, output_tokens)
 
         return LLMResponse(
@@ -258,6 +408,7 @@ class LLMClient:
             output_tokens=output_tokens,
             model=model,
             cost=cost,
+            cached_tokens=cached_tokens,
         )
 
     async def _invoke_openai(
@@ -269,6 +420,7 @@ class LLMClient:
         temperature: float,
         max_tokens: int,
         top_p: float,
+        json_schema: dict[str, object] | None = None,
     ) -> LLMResponse:
         """Call OpenAI Chat Completions API."""
         client = self._get_openai()
@@ -278,6 +430,15 @@ class LLMClient:
             *messages,
         ]
 
+        extra: dict[str, object] = {}
+        if json_schema is not None:
+            extra = {
+                "response_format": {
+                    "type": "json_schema",
+                    "json_schema": {"name": "report", "schema": json_schema},
+                }
+            }
+
         try:
             response = await client.chat.completions.create(
                 model=model,
@@ -285,6 +446,7 @@ class LLMClient:
                 temperature=temperature,
                 max_tokens=max_tokens,
                 top_p=top_p,
+                **extra,  # type: ignore[arg-type]
             )
         except Exception as exc:
             logger.error("OpenAI API call failed: %s", exc, exc_info=True)
@@ -302,6 +464,9 @@ class LLMClient:
 
         input_tokens = usage.prompt_tokens if usage else 0
         output_tokens = usage.completion_tokens if usage else 0
+        # OpenAI caches prompts implicitly; surface the cached share if present
+        prompt_details = getattr(usage, "prompt_tokens_details", None) if usage else None
+        cached_tokens = int(getattr(prompt_details, "cached_tokens", 0) or 0)
         cost = self._calculate_cost(model, input_tokens, output_tokens)
 
         return LLMResponse(
@@ -310,6 +475,7 @@ class LLMClient:
             output_tokens=output_tokens,
             model=model,
             cost=cost,
+            cached_tokens=cached_tokens,
         )
 
     async def _invoke_google(
@@ -362,6 +528,9 @@ class LLMClient:
         usage_meta = getattr(response, "usage_metadata", None)
         input_tokens = getattr(usage_meta, "prompt_token_count", 0) if usage_meta else 0
         output_tokens = getattr(usage_meta, "candidates_token_count", 0) if usage_meta else 0
+        cached_tokens = (
+            int(getattr(usage_meta, "cached_content_token_count", 0) or 0) if usage_meta else 0
+        )
 
         resolved_model = _GEMINI_MODEL_MAP.get(model, model)
         cost = self._calculate_cost(resolved_model, input_tokens, output_tokens)
@@ -372,6 +541,7 @@ class LLMClient:
             output_tokens=output_tokens,
             model=model,
             cost=cost,
+            cached_tokens=cached_tokens,
         )
 
     # -- cost calculation ----------------------------------------------
@@ -381,11 +551,10 @@ class LLMClient:
         """Calculate the USD cost for a given model invocation.
 
         Pricing is per 1 M tokens. Unknown models default to zero cost
-        (logged as warning).
+        (logged as warning, once per model per process).
         """
-        pricing = _MODEL_PRICING.get(model)
+        pricing = _pricing_for(model)
         if pricing is None:
-            logger.warning("No pricing data for model '%s'; cost reported as 0.0", model)
             return 0.0
 
         input_price_per_m, output_price_per_m = pricing
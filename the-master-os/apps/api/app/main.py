@@ -13,9 +13,11 @@ import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
+import anyio
 import sentry_sdk
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sentry_sdk.integrations.fastapi import FastApiIntegration
 from sentry_sdk.integrations.starlette import StarletteIntegration
 
@@ -29,6 +31,7 @@ from app.middleware.security_headers import SecurityHeadersMiddleware
 from app.pipeline import PipelineEngine
 from app.routers import agents, agent_execute, auto_healing, business_plans, debates, document_validation, grant_factory, health, marketing, mcp_hub, pipelines
 from app.scheduler import init_health_monitor, init_vault_scheduler, shutdown_health_monitor, shutdown_vault_scheduler
+from app.services.audit_buffer import start_audit_buffer, stop_audit_buffer
 from app.services.scheduler import ContentScheduler
 from app.ws import ConnectionManager, ws_router
 
@@ -54,6 +57,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # P0-07: Validate CORS in production
     settings.validate_production_cors()
 
+    # Widen the default anyio worker pool (40 threads): every blocking
+    # Supabase .execute() runs through run_in_threadpool, so the pool size
+    # is the effective DB concurrency ceiling under load.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 100
+
     # Sentry initialisation (no-op when DSN is empty)
     if settings.sentry_dsn:
         sentry_sdk.init(
@@ -158,10 +166,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             exc_info=True,
         )
 
+    # Batched audit-log writer (see app.services.audit_buffer)
+    start_audit_buffer()
+
     yield
 
     # --- Shutdown ---
     logger.info("Shutting down The Master OS API")
+    await stop_audit_buffer()
     if scheduler is not None:
         await scheduler.stop()
     await shutdown_vault_scheduler()
@@ -183,6 +195,9 @@ def create_app() -> FastAPI:
         docs_url=None if is_prod else "/docs",
         redoc_url=None if is_prod else "/redoc",
         openapi_url=None if is_prod else "/openapi.json",
+        # orjson serializes the datetime-heavy response envelopes several
+        # times faster than the stdlib json encoder.
+        default_response_class=ORJSONResponse,
     )
 
     # --- State ---
@@ -5,6 +5,8 @@ import json
 import logging
 import time
 from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+from functools import lru_cache
 
 import sentry_sdk
 import anthropic
@@ -13,11 +15,18 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from app.config import get_settings
+from app.deps.supabase import get_shared_supabase
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/agents", tags=["agent-execute"])
 
+# SSE delta coalescing: flush the accumulated text every 25 ms or 128 chars,
+# whichever comes first. Batches per-token framing/TCP overhead without
+# hurting time-to-first-token (the first delta always flushes immediately).
+_FLUSH_INTERVAL_S = 0.025
+_FLUSH_MAX_CHARS = 128
+
 
 class ExecuteRequest(BaseModel):
     input_text: str
@@ -26,15 +35,29 @@ class ExecuteRequest(BaseModel):
     max_tokens: int = 4096
 
 
+@lru_cache(maxsize=1)
+def _anthropic_api_key() -> str:
+    """Capture the Anthropic API key once at first use."""
+    return get_settings().anthropic_api_key
+
+
 def _get_supabase():  # noqa: ANN202
-    """Create a sync Supabase client from settings."""
-    from supabase import create_client  # noqa: WPS433
+    """Return the process-wide pooled Supabase client."""
+    return get_shared_supabase()
 
-    settings = get_settings()
-    return create_client(settings.supabase_url, settings.supabase_service_role_key)
 
+@dataclass(slots=True)
+class AgentRow:
+    """Resolved agent record with defaults applied once at fetch time."""
 
-def _fetch_agent_sync(agent_id: str) -> dict[str, object]:
+    id: str
+    name: str
+    system_prompt: str
+    model: str
+    model_provider: str
+
+
+def _fetch_agent_sync(agent_id: str) -> AgentRow:
     """Fetch agent row from Supabase synchronously."""
     sb = _get_supabase()
     result = (
@@ -46,35 +69,56 @@ def _fetch_agent_sync(agent_id: str) -> dict[str, object]:
     )
     if not result.data:
         raise HTTPException(status_code=404, detail="Agent not found")
-    return dict(result.data)
+    row = result.data
+    name = str(row.get("name") or "Agent")
+    return AgentRow(
+        id=str(row["id"]),
+        name=name,
+        system_prompt=str(row.get("system_prompt") or f"You are {name}, an AI assistant."),
+        model=str(row.get("model") or "claude-sonnet-4-6"),
+        model_provider=str(row.get("model_provider") or "anthropic"),
+    )
 
 
 async def _stream_anthropic(
-    agent: dict[str, object],
+    agent: AgentRow,
     input_text: str,
     max_tokens: int,
-) -> AsyncGenerator[str, None]:
-    """Stream Anthropic API response as SSE."""
-    settings = get_settings()
-    client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+) -> AsyncGenerator[dict[str, object], None]:
+    """Stream Anthropic API response as structured payload dicts.
 
-    system_prompt = str(agent.get("system_prompt") or f"You are {agent['name']}, an AI assistant.")
-    model = str(agent.get("model") or "claude-sonnet-4-6")
+    Yields ``{"type": "text" | "done" | "error", ...}`` payloads; SSE framing
+    is done once by the caller, which also reads stats off the dicts directly
+    instead of re-parsing serialized frames.
+    """
+    client = anthropic.Anthropic(api_key=_anthropic_api_key())
 
     try:
         with client.messages.stream(
-            model=model,
+            model=agent.model,
             max_tokens=max_tokens,
-            system=system_prompt,
+            system=agent.system_prompt,
             messages=[{"role": "user", "content": input_text}],
         ) as stream:
+            buf: list[str] = []
+            buf_len = 0
+            last_flush = 0.0  # monotonic zero => the first delta flushes at once
             for text in stream.text_stream:
-                data = json.dumps({"type": "text", "text": text})
-                yield f"data: {data}\n\n"
+                buf.append(text)
+                buf_len += len(text)
+                now = time.monotonic()
+                if buf_len >= _FLUSH_MAX_CHARS or now - last_flush >= _FLUSH_INTERVAL_S:
+                    yield {"type": "text", "text": "".join(buf)}
+                    buf.clear()
+                    buf_len = 0
+                    last_flush = now
+
+            if buf:
+                yield {"type": "text", "text": "".join(buf)}
 
             # Final usage stats
             final_msg = stream.get_final_message()
-            usage = {
+            yield {
                 "type": "done",
                 "tokens_input": final_msg.usage.input_tokens,
                 "tokens_output": final_msg.usage.output_tokens,
@@ -85,12 +129,10 @@ async def _stream_anthropic(
                     6,
                 ),
             }
-            yield f"data: {json.dumps(usage)}\n\n"
     except Exception as exc:
         sentry_sdk.capture_exception(exc)
-        logger.exception("Anthropic stream error for agent %s", agent.get("id"))
-        error_data = json.dumps({"type": "error", "message": str(exc)})
-        yield f"data: {error_data}\n\n"
+        logger.exception("Anthropic stream error for agent %s", agent.id)
+        yield {"type": "error", "message": str(exc)}
 
 
 @router.post("/{agent_id}/execute")
@@ -136,23 +178,19 @@ async def execute_agent(
         had_error = False
         error_msg = ""
 
-        async for chunk in _stream_anthropic(agent, body.input_text, body.max_tokens):
-            yield chunk
-            # Parse to capture stats
-            if chunk.startswith("data: "):
-                try:
-                    payload = json.loads(chunk[6:])
-                    if payload.get("type") == "text":
-                        full_text += payload.get("text", "")
-                    elif payload.get("type") == "done":
-                        tokens_in = payload.get("tokens_input", 0)
-                        tokens_out = payload.get("tokens_output", 0)
-                        cost = payload.get("cost_usd", 0.0)
-                    elif payload.get("type") == "error":
-                        had_error = True
-                        error_msg = payload.get("message", "Unknown error")
-                except Exception as parse_exc:
-                    sentry_sdk.capture_exception(parse_exc)
+        async for payload in _stream_anthropic(agent, body.input_text, body.max_tokens):
+            yield f"data: {json.dumps(payload)}\n\n"
+            # Capture stats straight off the structured payload
+            payload_type = payload.get("type")
+            if payload_type == "text":
+                full_text += str(payload.get("text", ""))
+            elif payload_type == "done":
+                tokens_in = int(payload.get("tokens_input", 0))  # type: ignore[arg-type]
+                tokens_out = int(payload.get("tokens_output", 0))  # type: ignore[arg-type]
+                cost = float(payload.get("cost_usd", 0.0))  # type: ignore[arg-type]
+            elif payload_type == "error":
+                had_error = True
+                error_msg = str(payload.get("message", "Unknown error"))
 
         # Update task record
         if task_id:
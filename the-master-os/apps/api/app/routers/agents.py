@@ -9,12 +9,21 @@ ARCH-MASTEROS-v1 section 3.2 — Agent Runtime:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
+import time
+from collections.abc import Mapping
 from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Final
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 
 from app.config import Settings, get_settings
+from app.deps.supabase import get_shared_supabase
 from app.llm import LLMClient
 from app.llm.prompt_builder import build_messages
 from app.middleware.auth import AuthenticatedUser, get_current_user
@@ -27,40 +36,91 @@ from app.schemas.agents import (
     TokenUsage,
 )
 from app.schemas.common import BaseResponse
+from app.services.audit_buffer import enqueue_audit_log
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/orchestrate/agent", tags=["agents"])
 
+# Assignment status → runtime status, built once at import time.
+_ASSIGNMENT_TO_RUNTIME_STATUS: Final[Mapping[str, str]] = MappingProxyType({
+    "idle": "idle",
+    "assigned": "assigned",
+    "executing": "executing",
+    "error": "error",
+    "released": "released",
+})
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def _supabase_client(settings: Settings):  # noqa: ANN202
-    """Create a Supabase client from settings.
+# Columns actually consumed by the invoke/assign/status handlers and LLMClient.
+_AGENT_COLUMNS = "id, name, system_prompt, model, model_provider, parameters, status"
 
-    Uses supabase-py (already in dependencies).
-    """
-    from supabase import create_client  # noqa: WPS433 -- lazy import
+# Agent rows (system_prompt, model, provider) rarely change — cache them
+# in-process for a short TTL so repeat invokes skip the Supabase lookup.
+_AGENT_CACHE_TTL_S = 60.0
+_AGENT_CACHE_MAX = 1024
+_agent_cache: dict[str, tuple[float, dict[str, object]]] = {}
+
+
+# Built system preambles (system prompt + serialized context) repeat across
+# workflow invocations; cache them so re-builds and provider-side
+# re-tokenization of identical prefixes are skipped.
+_PROMPT_PREFIX_TTL_S = 300.0
+_PROMPT_PREFIX_MAX = 512
+_prompt_prefix_cache: dict[str, tuple[float, str]] = {}
+
+
+def _build_system_prefix(
+    agent_id: str, system_prompt: str, context: dict[str, object]
+) -> str:
+    """Return the enriched system preamble, reusing a cached build when possible."""
+    context_json = json.dumps(context, ensure_ascii=False, sort_keys=True)
+    prefix_key = hashlib.sha256(
+        f"{agent_id}\x00{system_prompt}\x00{context_json}".encode()
+    ).hexdigest()
 
-    return create_client(settings.supabase_url, settings.supabase_service_role_key)
+    cached = _prompt_prefix_cache.get(prefix_key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    built = build_messages(system_prompt=system_prompt, user_input="", context=context)
+    system_content = next(
+        (msg["content"] for msg in built if msg["role"] == "system"), system_prompt
+    )
+
+    if len(_prompt_prefix_cache) >= _PROMPT_PREFIX_MAX:
+        _prompt_prefix_cache.clear()
+    _prompt_prefix_cache[prefix_key] = (time.monotonic() + _PROMPT_PREFIX_TTL_S, system_content)
+    return system_content
+
+
+def invalidate_agent(agent_id: str) -> None:
+    """Drop a cached agent row — wire this to any admin agent-update path."""
+    _agent_cache.pop(agent_id, None)
 
 
 async def _fetch_agent(agent_id: str, settings: Settings) -> dict[str, object]:
-    """Fetch an agent record from Supabase by ID.
+    """Fetch an agent record from Supabase by ID, via a short-TTL cache.
 
     Raises HTTPException 404 if not found.
     """
-    client = _supabase_client(settings)
-    response = (
+    cached = _agent_cache.get(agent_id)
+    if cached is not None and cached[0] > time.monotonic():
+        return dict(cached[1])
+
+    client = get_shared_supabase()
+    response = await run_in_threadpool(
         client.table("agents")
-        .select("*")
+        .select(_AGENT_COLUMNS)
         .eq("id", agent_id)
         .eq("is_active", True)
         .single()
-        .execute()
+        .execute
     )
 
     if not response.data:
@@ -72,7 +132,11 @@ async def _fetch_agent(agent_id: str, settings: Settings) -> dict[str, object]:
             },
         )
 
-    return dict(response.data)
+    row = dict(response.data)
+    if len(_agent_cache) >= _AGENT_CACHE_MAX:
+        _agent_cache.clear()
+    _agent_cache[agent_id] = (time.monotonic() + _AGENT_CACHE_TTL_S, row)
+    return dict(row)
 
 
 # ---------------------------------------------------------------------------
@@ -94,7 +158,7 @@ async def assign_agent(
     """Allocate runtime resources for an agent within a workspace.
 
     1. Validate that the agent exists and is active.
-    2. Upsert an ``agent_assignments`` row (idle, assigned_at=now).
+    2. Update the active ``agent_assignments`` row or insert a new one.
     3. Return the assignment record wrapped in ``BaseResponse``.
     """
     logger.info(
@@ -107,26 +171,30 @@ async def assign_agent(
     # 1. Validate agent exists and is active
     agent_row = await _fetch_agent(body.agent_id, settings)
 
-    # 2. Upsert agent_assignments (unique on agent_id+workspace_id where released_at IS NULL)
-    sb = _supabase_client(settings)
+    # 2. Update the active assignment or insert a new one. The only unique
+    #    index on (agent_id, workspace_id) is partial (WHERE released_at IS
+    #    NULL), which PostgREST upsert cannot target — ON CONFLICT without
+    #    the predicate is rejected by Postgres (42P10) — so the two-step
+    #    flow stays.
+    sb = get_shared_supabase()
     now_iso = datetime.now(tz=timezone.utc).isoformat()
 
     try:
         # Check for an existing active assignment (released_at IS NULL)
-        existing_resp = (
+        existing_resp = await run_in_threadpool(
             sb.table("agent_assignments")
             .select("id")
             .eq("agent_id", body.agent_id)
             .eq("workspace_id", body.workspace_id)
             .is_("released_at", "null")
             .limit(1)
-            .execute()
+            .execute
         )
 
         if existing_resp.data:
             # Update the existing active assignment
             existing_id: str = str(existing_resp.data[0]["id"])
-            upsert_resp = (
+            await run_in_threadpool(
                 sb.table("agent_assignments")
                 .update({
                     "status": "idle",
@@ -136,11 +204,11 @@ async def assign_agent(
                     "released_at": None,
                 })
                 .eq("id", existing_id)
-                .execute()
+                .execute
             )
         else:
             # Insert a new assignment
-            upsert_resp = (
+            await run_in_threadpool(
                 sb.table("agent_assignments")
                 .insert({
                     "agent_id": body.agent_id,
@@ -151,7 +219,7 @@ async def assign_agent(
                     "is_active": True,
                     "assigned_at": now_iso,
                 })
-                .execute()
+                .execute
             )
     except Exception as exc:
         logger.exception(
@@ -209,22 +277,26 @@ async def release_agent(
         user.user_id,
     )
 
-    sb = _supabase_client(settings)
+    sb = get_shared_supabase()
     now_iso = datetime.now(tz=timezone.utc).isoformat()
 
     try:
-        # Find active assignment for this agent + workspace
-        existing_resp = (
+        # Release the active assignment in one conditional UPDATE; an empty
+        # returned row set means there was nothing to release.
+        update_resp = await run_in_threadpool(
             sb.table("agent_assignments")
-            .select("id")
+            .update({
+                "status": "idle",
+                "is_active": False,
+                "released_at": now_iso,
+            })
             .eq("agent_id", body.agent_id)
             .eq("workspace_id", body.workspace_id)
             .is_("released_at", "null")
-            .limit(1)
-            .execute()
+            .execute
         )
 
-        if not existing_resp.data:
+        if not update_resp.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={
@@ -236,15 +308,6 @@ async def release_agent(
                 },
             )
 
-        assignment_id: str = str(existing_resp.data[0]["id"])
-
-        # Release the assignment
-        sb.table("agent_assignments").update({
-            "status": "idle",
-            "is_active": False,
-            "released_at": now_iso,
-        }).eq("id", assignment_id).execute()
-
     except HTTPException:
         raise  # Re-raise 404 as-is
     except Exception as exc:
@@ -310,64 +373,43 @@ async def invoke_agent(
         {"role": m.role, "content": m.content} for m in body.messages
     ]
 
-    # If context is provided, enrich the system prompt via prompt_builder
+    # If context is provided, enrich the system prompt via the cached prefix
+    # builder; the provider call below tags it for prompt caching as well.
     agent_row_for_invoke = dict(agent_row)
     if body.context:
-        enriched = build_messages(
-            system_prompt=system_prompt,
-            user_input=user_messages_raw[-1]["content"],
-            context=body.context,
+        agent_row_for_invoke["system_prompt"] = _build_system_prefix(
+            body.agent_id, system_prompt, body.context
         )
-        # Extract system content from built messages
-        system_content = ""
-        conversation_messages: list[dict[str, str]] = []
-        for msg in enriched:
-            if msg["role"] == "system":
-                system_content = msg["content"]
-            else:
-                conversation_messages.append(msg)
-        # Prepend earlier messages (excluding last user msg which is in enriched)
-        if len(user_messages_raw) > 1:
-            conversation_messages = user_messages_raw[:-1] + conversation_messages
-        agent_row_for_invoke["system_prompt"] = system_content
-        messages_for_llm = conversation_messages
-    else:
-        messages_for_llm = user_messages_raw
+    messages_for_llm = user_messages_raw
 
     # 3. Invoke LLM
     llm_client = LLMClient(_settings=settings)
     llm_response = await llm_client.invoke(agent_row_for_invoke, messages_for_llm)
 
-    # 4. Log the invocation (best-effort audit)
-    try:
-        sb = _supabase_client(settings)
-        sb.table("audit_logs").insert({
-            "workspace_id": body.workspace_id,
-            "user_id": user.user_id,
-            "action": "agent.invoke",
-            "category": "agent",
-            "resource_type": "agent",
-            "resource_id": body.agent_id,
-            "details": {
-                "model": llm_response.model,
-                "input_tokens": llm_response.input_tokens,
-                "output_tokens": llm_response.output_tokens,
-                "cost": llm_response.cost,
-            },
-            "severity": "info",
-        }).execute()
-    except Exception:
-        logger.warning(
-            "Failed to write audit log for agent invoke: agent_id=%s",
-            body.agent_id,
-            exc_info=True,
-        )
+    # 4. Log the invocation via the buffered flusher (best-effort audit)
+    enqueue_audit_log({
+        "workspace_id": body.workspace_id,
+        "user_id": user.user_id,
+        "action": "agent.invoke",
+        "category": "agent",
+        "resource_type": "agent",
+        "resource_id": body.agent_id,
+        "details": {
+            "model": llm_response.model,
+            "input_tokens": llm_response.input_tokens,
+            "output_tokens": llm_response.output_tokens,
+            "cached_tokens": llm_response.cached_tokens,
+            "cost": llm_response.cost,
+        },
+        "severity": "info",
+    })
 
     response_data = AgentInvokeResponse(
         content=llm_response.content,
         usage=TokenUsage(
             input_tokens=llm_response.input_tokens,
             output_tokens=llm_response.output_tokens,
+            cached_tokens=llm_response.cached_tokens,
         ),
         cost=llm_response.cost,
         model=llm_response.model,
@@ -402,18 +444,19 @@ async def get_agent_status(
         user.user_id,
     )
 
-    # 1. Fetch agent record
-    agent_row = await _fetch_agent(agent_id, settings)
-
-    # 2. Fetch latest assignment for this agent
-    sb = _supabase_client(settings)
-    assignment_response = (
-        sb.table("agent_assignments")
-        .select("*")
-        .eq("agent_id", agent_id)
-        .order("created_at", desc=True)
-        .limit(1)
-        .execute()
+    # Fetch the agent record and its latest assignment concurrently — the
+    # two reads are independent, so overlap their network waits.
+    sb = get_shared_supabase()
+    agent_row, assignment_response = await asyncio.gather(
+        _fetch_agent(agent_id, settings),
+        run_in_threadpool(
+            sb.table("agent_assignments")
+            .select("*")
+            .eq("agent_id", agent_id)
+            .order("created_at", desc=True)
+            .limit(1)
+            .execute
+        ),
     )
 
     assignment = assignment_response.data[0] if assignment_response.data else None
@@ -427,15 +470,7 @@ async def get_agent_status(
     if assignment:
         workspace_id = str(assignment.get("workspace_id", ""))
         assignment_status = str(assignment.get("status", "idle"))
-        # Map assignment status to runtime status
-        status_map: dict[str, str] = {
-            "idle": "idle",
-            "assigned": "assigned",
-            "executing": "executing",
-            "error": "error",
-            "released": "released",
-        }
-        agent_status = status_map.get(assignment_status, "idle")
+        agent_status = _ASSIGNMENT_TO_RUNTIME_STATUS.get(assignment_status, "idle")
         raw_assigned_at = assignment.get("created_at")
         if raw_assigned_at and isinstance(raw_assigned_at, str):
             try:
@@ -10,16 +10,20 @@ Output: 9개 섹션 (executive_summary, problem, solution, market_analysis,
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import re
-from typing import Any
+import time
+from functools import lru_cache
+from typing import Any, Final
 
 import sentry_sdk
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel, Field
 
 from app.config import Settings, get_settings
+from app.llm import cache_stats
 from app.llm.client import LLMClient, LLMResponse
 from app.middleware.auth import AuthenticatedUser, get_current_user
 from app.schemas.common import BaseResponse
@@ -28,6 +32,20 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/orchestrate/business-plans", tags=["business-plans"])
 
+# Near-duplicate plan cache — paraphrase-tolerant via field normalization
+# (case/whitespace folding) rather than an embedding store, which this
+# service doesn't carry. A hit skips the entire LLM round-trip.
+_PLAN_CACHE_TTL_S = 3600.0
+_PLAN_CACHE_MAX = 256
+_plan_cache: dict[str, tuple[float, GenerateResponse]] = {}
+
+# Exact-match layer in front of the normalized cache: byte-identical
+# request bodies (retries, dev iteration) skip even the normalization.
+_exact_cache: dict[str, tuple[float, GenerateResponse]] = {}
+
+# LLM 응답 파싱용 정규식 (모듈 로드 시 1회 컴파일)
+_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?```", re.DOTALL)
+
 
 # ---------------------------------------------------------------------------
 # Schemas
@@ -123,8 +141,9 @@ def _get_llm_client(request: Request) -> LLMClient:
     return client
 
 
+@lru_cache(maxsize=1024)
 def _format_krw(value: float) -> str:
-    """한국 원화 포맷."""
+    """한국 원화 포맷 (동일 금액 반복 호출은 메모이즈)."""
     if value >= 1_000_000_000_000:
         return f"{value / 1_000_000_000_000:.1f}조원"
     if value >= 100_000_000:
@@ -134,9 +153,8 @@ def _format_krw(value: float) -> str:
     return f"{value:.0f}원"
 
 
-def _build_system_prompt() -> str:
-    """사업계획서 생성용 시스템 프롬프트."""
-    return """당신은 한국 스타트업 사업계획서 전문 작성 AI입니다.
+# 사업계획서 생성용 시스템 프롬프트 (모듈 로드 시 1회 생성되는 상수)
+_SYSTEM_PROMPT: Final[str] = """당신은 한국 스타트업 사업계획서 전문 작성 AI입니다.
 사용자가 제공하는 회사 정보를 바탕으로 투자자 대상 사업계획서의 각 섹션을 한국어로 작성합니다.
 
 반드시 아래 JSON 형식으로만 응답하세요. JSON 외의 텍스트는 포함하지 마세요.
@@ -180,17 +198,12 @@ def _build_system_prompt() -> str:
 
 def _build_user_message(body: GenerateRequest) -> str:
     """사용자 메시지 구성."""
-    competitors_text = ""
-    if body.competitors:
-        lines: list[str] = []
-        for comp in body.competitors:
-            parts = [f"- {comp.name}"]
-            if comp.strength:
-                parts.append(f"(강점: {comp.strength})")
-            if comp.weakness:
-                parts.append(f"(약점: {comp.weakness})")
-            lines.append(" ".join(parts))
-        competitors_text = "\n".join(lines)
+    competitors_text = "\n".join(
+        f"- {comp.name}"
+        + (f" (강점: {comp.strength})" if comp.strength else "")
+        + (f" (약점: {comp.weakness})" if comp.weakness else "")
+        for comp in body.competitors
+    )
 
     return f"""다음 회사 정보를 바탕으로 사업계획서를 작성해주세요.
 
@@ -205,37 +218,109 @@ SOM (획득 가능 시장): {_format_krw(body.som_value) if body.som_value else
 {competitors_text or '미입력'}"""
 
 
+_NON_NUMERIC_RE = re.compile(r"[^\d.\-]")
+
+
+def _to_float(value: Any) -> float:
+    """숫자/숫자 문자열/통화 표기("5억원" 등)를 float로 관대하게 변환."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        cleaned = _NON_NUMERIC_RE.sub("", value)
+        if cleaned and cleaned not in ("-", ".", "-."):
+            try:
+                return float(cleaned)
+            except ValueError:
+                pass
+    return 0.0
+
+
+def _coerce_floats(seq: Any, n: int) -> list[float]:
+    """시퀀스를 길이 n의 float 리스트로 변환 (부족분은 0.0으로 채움)."""
+    values = [_to_float(v) for v in (seq if isinstance(seq, list) else [])][:n]
+    values.extend([0.0] * (n - len(values)))
+    return values
+
+
+def _find_json_span(content: str) -> tuple[int, int] | None:
+    r"""첫 번째 최상위 JSON 객체의 (start, end) 범위를 O(n) 스캔으로 찾는다.
+
+    문자열 리터럴과 이스케이프를 인식하는 depth 카운터 방식이라
+    정규식 `\{.*\}`의 greedy 백트래킹과 달리 JSON 뒤에 붙은
+    설명 텍스트에도 안전하다.
+    """
+    start = content.find("{")
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for idx in range(start, len(content)):
+        ch = content[idx]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return start, idx + 1
+    return None
+
+
 def _extract_json_from_response(content: str) -> dict[str, Any]:
     """LLM 응답에서 JSON을 추출.
 
     마크다운 코드블록이나 앞뒤 텍스트가 포함되어 있어도 JSON만 추출한다.
     """
+    # 행동이 좋은 모델 응답은 순수 JSON — 정규식/스캔 없이 바로 파싱
+    stripped = content.strip()
+    if stripped.startswith("{") and stripped.endswith("}"):
+        try:
+            return json.loads(stripped)  # type: ignore[no-any-return]
+        except json.JSONDecodeError:
+            pass
+
     # 마크다운 코드블록 제거
-    code_block_match = re.search(r"```(?:json)?\s*\n?(.*?)\n?```", content, re.DOTALL)
+    code_block_match = _CODE_BLOCK_RE.search(content)
     if code_block_match:
         content = code_block_match.group(1)
 
-    # JSON 객체 추출 (첫 번째 { 부터 마지막 } 까지)
-    brace_match = re.search(r"\{.*\}", content, re.DOTALL)
-    if not brace_match:
+    # 첫 번째 완결된 최상위 JSON 객체만 추출 (뒤따르는 텍스트 무시)
+    span = _find_json_span(content)
+    if span is None:
         raise ValueError("LLM 응답에서 JSON 객체를 찾을 수 없습니다")
 
-    return json.loads(brace_match.group(0))  # type: ignore[no-any-return]
+    return json.loads(content[span[0]:span[1]])  # type: ignore[no-any-return]
 
 
 def _parse_sections(raw: dict[str, Any], body: GenerateRequest) -> GeneratedSections:
-    """LLM JSON 응답을 GeneratedSections로 안전하게 파싱."""
+    """LLM JSON 응답을 GeneratedSections로 안전하게 파싱.
+
+    아래의 명시적 float()/str() 강제 변환이 필드 타입을 보장하므로,
+    model_construct로 Pydantic 검증 파이프라인을 생략한다 (요청 본문
+    GenerateRequest는 계속 전체 검증을 거친다).
+    """
     # market_analysis
     raw_market = raw.get("market_analysis", {})
     if isinstance(raw_market, dict):
-        market = MarketAnalysis(
+        market = MarketAnalysis.model_construct(
             tam=float(raw_market.get("tam", body.tam_value)),
             sam=float(raw_market.get("sam", body.sam_value)),
             som=float(raw_market.get("som", body.som_value)),
             description=str(raw_market.get("description", "")),
         )
     else:
-        market = MarketAnalysis(
+        market = MarketAnalysis.model_construct(
             tam=body.tam_value,
             sam=body.sam_value,
             som=body.som_value,
@@ -245,11 +330,20 @@ def _parse_sections(raw: dict[str, Any], body: GenerateRequest) -> GeneratedSect
     # financial_projection
     raw_fin = raw.get("financial_projection", {})
     if isinstance(raw_fin, dict):
-        fin = FinancialProjection(
+        revenue = _coerce_floats(raw_fin.get("revenue"), 3)
+        cost = _coerce_floats(raw_fin.get("cost"), 3)
+        raw_profit = raw_fin.get("profit")
+        # LLM이 profit을 누락하면 0 배열 대신 매출-비용으로 직접 계산.
+        profit = (
+            _coerce_floats(raw_profit, 3)
+            if raw_profit is not None
+            else [r - c for r, c in zip(revenue, cost, strict=True)]
+        )
+        fin = FinancialProjection.model_construct(
             years=raw_fin.get("years", ["1년차", "2년차", "3년차"]),
-            revenue=[float(v) for v in raw_fin.get("revenue", [0, 0, 0])],
-            cost=[float(v) for v in raw_fin.get("cost", [0, 0, 0])],
-            profit=[float(v) for v in raw_fin.get("profit", [0, 0, 0])],
+            revenue=revenue,
+            cost=cost,
+            profit=profit,
         )
     else:
         fin = FinancialProjection()
@@ -267,7 +361,7 @@ def _parse_sections(raw: dict[str, Any], body: GenerateRequest) -> GeneratedSect
     else:
         timeline = {"milestones": []}
 
-    return GeneratedSections(
+    return GeneratedSections.model_construct(
         executive_summary=str(raw.get("executive_summary", "")),
         problem=str(raw.get("problem", "")),
         solution=str(raw.get("solution", "")),
@@ -280,6 +374,52 @@ def _parse_sections(raw: dict[str, Any], body: GenerateRequest) -> GeneratedSect
     )
 
 
+async def _invoke_with_incremental_parse(
+    llm_client: LLMClient,
+    agent_row: dict[str, object],
+    messages: list[dict[str, str]],
+    model: str,
+) -> tuple[LLMResponse, dict[str, Any] | None]:
+    """스트리밍으로 LLM을 호출하며 도착분을 즉시 파싱 시도.
+
+    '}'로 닫히는 청크마다 _find_json_span으로 완결 여부를 확인해,
+    JSON 객체가 완성되면 이후 청크는 파싱하지 않는다. 스트림은 'done'
+    이벤트까지 소비한다 — 실제 토큰 사용량/비용이 거기에 실려 오므로
+    조기에 끊으면 모든 생성이 0 토큰으로 집계된다.
+    """
+    chunks: list[str] = []
+    parsed: dict[str, Any] | None = None
+    final_response: LLMResponse | None = None
+
+    stream = llm_client.invoke_stream(agent_row, messages)
+    async for event in stream:
+        if event["type"] == "done":
+            final_response = event["response"]  # type: ignore[assignment]
+            break
+        text = str(event.get("text", ""))
+        chunks.append(text)
+        if parsed is not None or not text.rstrip().endswith("}"):
+            continue
+        content = "".join(chunks)
+        span = _find_json_span(content)
+        if span is None:
+            continue
+        try:
+            parsed = json.loads(content[span[0]:span[1]])
+        except json.JSONDecodeError:
+            continue
+        logger.debug(
+            "Incremental parse completed mid-stream (%d chars)", len(content)
+        )
+
+    if final_response is None:
+        content = "".join(chunks)
+        final_response = LLMResponse(
+            content=content, input_tokens=0, output_tokens=0, model=model, cost=0.0
+        )
+    return final_response, parsed
+
+
 def _generate_mock_sections(body: GenerateRequest) -> GeneratedSections:
     """API 키가 없을 때 사용하는 mock fallback."""
     return GeneratedSections(
@@ -340,9 +480,58 @@ def _generate_mock_sections(body: GenerateRequest) -> GeneratedSections:
     )
 
 
-def _has_llm_keys(settings: Settings) -> bool:
-    """Anthropic 또는 OpenAI API 키가 설정되어 있는지 확인."""
-    return bool(settings.anthropic_api_key) or bool(settings.openai_api_key)
+def _normalize_field(value: str) -> str:
+    """공백/대소문자 차이를 무시하도록 입력 필드를 정규화."""
+    return " ".join(value.split()).casefold()
+
+
+def _exact_cache_key(body: GenerateRequest) -> str:
+    """요청 본문 전체의 canonical hash (exact-match 캐시 키)."""
+    raw = json.dumps(body.model_dump(), sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _semantic_cache_key(body: GenerateRequest) -> str:
+    """정규화된 요청 필드로 near-duplicate 캐시 키 생성."""
+    competitors = "|".join(
+        f"{_normalize_field(c.name)}:{_normalize_field(c.strength)}:{_normalize_field(c.weakness)}"
+        for c in body.competitors
+    )
+    raw = "\x00".join((
+        _normalize_field(body.company_name),
+        _normalize_field(body.industry),
+        _normalize_field(body.target_market),
+        _normalize_field(body.company_description),
+        f"{body.tam_value:g}",
+        f"{body.sam_value:g}",
+        f"{body.som_value:g}",
+        competitors,
+    ))
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _plan_cache_get(
+    store: dict[str, tuple[float, GenerateResponse]], key: str
+) -> GenerateResponse | None:
+    """TTL 내의 캐시된 생성 결과 반환 (만료 시 제거)."""
+    entry = store.get(key)
+    if entry is None:
+        return None
+    cached_at, response = entry
+    if time.monotonic() - cached_at > _PLAN_CACHE_TTL_S:
+        store.pop(key, None)
+        return None
+    return response
+
+
+def _plan_cache_put(
+    store: dict[str, tuple[float, GenerateResponse]], key: str, response: GenerateResponse
+) -> None:
+    """생성 결과 캐싱 (용량 초과 시 가장 오래된 항목 제거)."""
+    if len(store) >= _PLAN_CACHE_MAX:
+        oldest = min(store, key=lambda k: store[k][0])
+        store.pop(oldest, None)
+    store[key] = (time.monotonic(), response)
 
 
 # ---------------------------------------------------------------------------
@@ -374,7 +563,7 @@ async def generate_business_plan(
     )
 
     # API 키 없으면 mock fallback
-    if not _has_llm_keys(settings):
+    if not settings.has_llm_keys:
         logger.warning(
             "No LLM API key configured — returning mock business plan for company=%s",
             body.company_name,
@@ -385,6 +574,21 @@ async def generate_business_plan(
             meta={"source": "mock"},
         )
 
+    exact_key = _exact_cache_key(body)
+    cached = _plan_cache_get(_exact_cache, exact_key)
+    cache_stats.record("business_plan_exact", hit=cached is not None)
+    if cached is not None:
+        return BaseResponse(data=cached, meta={"source": "exact-cache"})
+
+    cache_key = _semantic_cache_key(body)
+    cached = _plan_cache_get(_plan_cache, cache_key)
+    cache_stats.record("business_plan_semantic", hit=cached is not None)
+    if cached is not None:
+        logger.info(
+            "Business plan cache hit: company=%s key=%s", body.company_name, cache_key
+        )
+        return BaseResponse(data=cached, meta={"source": "semantic-cache"})
+
     llm_client = _get_llm_client(request)
 
     # LLM provider 결정: Anthropic 우선, 없으면 OpenAI
@@ -398,7 +602,7 @@ async def generate_business_plan(
     agent_row: dict[str, object] = {
         "model_provider": provider,
         "model": model,
-        "system_prompt": _build_system_prompt(),
+        "system_prompt": _SYSTEM_PROMPT,
         "parameters": {
             "temperature": 0.7,
             "max_tokens": 4096,
@@ -410,8 +614,15 @@ async def generate_business_plan(
         {"role": "user", "content": _build_user_message(body)},
     ]
 
+    raw_json: dict[str, Any] | None = None
     try:
-        llm_response: LLMResponse = await llm_client.invoke(agent_row, messages)
+        if provider == "anthropic":
+            # 스트리밍 + 증분 파싱: 네트워크 수신과 파싱을 겹친다
+            llm_response, raw_json = await _invoke_with_incremental_parse(
+                llm_client, agent_row, messages, model
+            )
+        else:
+            llm_response = await llm_client.invoke(agent_row, messages)
     except HTTPException:
         # LLM 호출 실패 시 mock fallback
         logger.warning(
@@ -427,7 +638,8 @@ async def generate_business_plan(
 
     # LLM 응답 파싱
     try:
-        raw_json = _extract_json_from_response(llm_response.content)
+        if raw_json is None:
+            raw_json = _extract_json_from_response(llm_response.content)
         sections = _parse_sections(raw_json, body)
     except (json.JSONDecodeError, ValueError, KeyError) as exc:
         sentry_sdk.capture_exception(exc)
@@ -449,13 +661,14 @@ async def generate_business_plan(
             meta={"source": "mock-fallback", "reason": "json_parse_failed"},
         )
 
-    return BaseResponse(
-        data=GenerateResponse(
-            sections=sections,
-            model=llm_response.model,
-            input_tokens=llm_response.input_tokens,
-            output_tokens=llm_response.output_tokens,
-            cost=llm_response.cost,
-        ),
-        meta={"source": "llm"},
+    generated = GenerateResponse(
+        sections=sections,
+        model=llm_response.model,
+        input_tokens=llm_response.input_tokens,
+        output_tokens=llm_response.output_tokens,
+        cost=llm_response.cost,
     )
+    _plan_cache_put(_exact_cache, exact_key, generated)
+    _plan_cache_put(_plan_cache, cache_key, generated)
+
+    return BaseResponse(data=generated, meta={"source": "llm"})
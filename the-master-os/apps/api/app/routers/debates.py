@@ -10,22 +10,40 @@ Endpoints:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
 import random
+import time
 from typing import Literal
 
 import sentry_sdk
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel, Field
 
 from app.config import Settings, get_settings
-from app.llm import LLMClient, LLMResponse
+from app.llm import LLMClient, LLMResponse, cache_stats
 from app.schemas.common import BaseResponse
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/orchestrate/debates", tags=["debates"])
 
+# Exact-match response cache — identical rounds (same topic, agents,
+# context, and round number) repeat during retries and dev iteration;
+# serving them from memory avoids one LLM call per agent.
+_ROUND_CACHE_TTL_S = 3600.0
+_ROUND_CACHE_MAX = 256
+
+# Bound concurrent provider calls per round to stay clear of rate limits.
+_MAX_CONCURRENT_LLM_CALLS = 8
+
+# Older history adds token cost per agent per round (quadratic across a
+# debate) without improving the responses; only the recent tail is sent.
+_MAX_HISTORY_MSGS = 12
+_round_cache: dict[str, tuple[float, GenerateMessagesResponse]] = {}
+
 
 # ---------------------------------------------------------------------------
 # Request / Response schemas
@@ -184,8 +202,6 @@ def _parse_llm_response(raw: str) -> tuple[str, str, float]:
 
     Tries JSON parsing first, falls back to treating the whole response as message.
     """
-    import json
-
     # Attempt to extract JSON from the response
     try:
         # Try direct JSON parse
@@ -215,16 +231,27 @@ def _parse_llm_response(raw: str) -> tuple[str, str, float]:
     return raw.strip(), "LLM 응답에서 구조화된 추론을 추출하지 못했습니다.", 0.6
 
 
+def _render_simulation_templates(topic: str) -> dict[str, list[str]]:
+    """Render every simulation template for this topic once per request.
+
+    All agents in a round share the topic, so the ``{topic}`` substitution
+    is done here instead of per agent inside _generate_simulation_message.
+    """
+    return {
+        role: [template.format(topic=topic) for template in templates]
+        for role, templates in _SIMULATION_TEMPLATES.items()
+    }
+
+
 def _generate_simulation_message(
-    topic: str,
+    rendered_templates: dict[str, list[str]],
     agent: DebateAgent,
     previous_messages: list[dict[str, str]],
     round_number: int,
 ) -> GeneratedMessage:
     """Generate a simulated message when LLM is unavailable."""
-    templates = _SIMULATION_TEMPLATES.get(agent.agent_role, _SIMULATION_TEMPLATES["realist"])
-    template = random.choice(templates)  # noqa: S311 -- not security-critical
-    message_content = template.format(topic=topic)
+    candidates = rendered_templates.get(agent.agent_role, rendered_templates["realist"])
+    message_content = random.choice(candidates)  # noqa: S311 -- not security-critical
 
     # Add round awareness for rounds > 1
     if round_number > 1 and previous_messages:
@@ -243,9 +270,147 @@ def _generate_simulation_message(
     )
 
 
-def _has_llm_keys(settings: Settings) -> bool:
-    """Check if at least one LLM provider API key is configured."""
-    return bool(settings.anthropic_api_key) or bool(settings.openai_api_key)
+def _build_batch_system_prompt(roles: list[str]) -> str:
+    """Combine the role prompts present in this round into one system prompt."""
+    parts: list[str] = [
+        "당신은 다중 역할 토론 메시지 생성기입니다. "
+        "아래 역할 정의에 따라 요청된 모든 에이전트의 메시지를 한 번에 생성하세요.\n",
+    ]
+    for role in roles:
+        parts.append(f"[{role}] {_ROLE_SYSTEM_PROMPTS.get(role, _ROLE_SYSTEM_PROMPTS['realist'])}")
+    parts.append(
+        "\n반드시 아래 JSON 형식으로만 응답하세요. JSON 외의 텍스트는 포함하지 마세요:\n"
+        '{"responses": [{"agent_id": "...", "message": "토론 메시지 (150~300자 한국어)", '
+        '"reasoning": "근거/추론 과정", "confidence": 0.0~1.0}]}'
+    )
+    return "\n".join(parts)
+
+
+def _build_batch_user_prompt(
+    body: GenerateMessagesRequest, history: list[dict[str, str]]
+) -> str:
+    """One user prompt carrying the shared topic/context plus the agent list."""
+    parts: list[str] = [f"토론 주제: {body.topic}\n"]
+
+    if history:
+        parts.append("=== 이전 토론 내용 ===")
+        for msg in history:
+            parts.append(
+                f"[{msg.get('agent_role', '참여자')}] {msg.get('agent_name', '에이전트')}: "
+                f"{msg.get('content', '')}"
+            )
+        parts.append("=== 이전 내용 끝 ===\n")
+
+    parts.append(f"라운드 {body.round_number}: 다음 에이전트 각각의 메시지를 생성하세요.")
+    for agent in body.agents:
+        parts.append(
+            f"- agent_id={agent.agent_id}, 역할={agent.agent_role}, 이름={agent.agent_name}"
+        )
+
+    return "\n".join(parts)
+
+
+def _parse_batch_response(
+    raw: str, agents: list[DebateAgent]
+) -> list[GeneratedMessage] | None:
+    """Map a batched {"responses": [...]} payload back onto the agent list.
+
+    Returns None when any agent is missing or unparseable so the caller
+    can fall back to per-agent invocations.
+    """
+    try:
+        start = raw.index("{")
+        end = raw.rindex("}") + 1
+        parsed = json.loads(raw[start:end])
+    except (ValueError, json.JSONDecodeError):
+        return None
+
+    if not isinstance(parsed, dict):
+        return None
+    entries = parsed.get("responses")
+    if not isinstance(entries, list):
+        return None
+
+    by_agent_id = {
+        str(entry.get("agent_id")): entry
+        for entry in entries
+        if isinstance(entry, dict)
+    }
+
+    messages: list[GeneratedMessage] = []
+    for agent in agents:
+        entry = by_agent_id.get(agent.agent_id)
+        if entry is None:
+            return None
+        message_content = str(entry.get("message", "")).strip()
+        if not message_content:
+            return None
+        try:
+            confidence = float(entry.get("confidence", 0.7))
+        except (TypeError, ValueError):
+            confidence = 0.7
+        messages.append(
+            GeneratedMessage(
+                agent_id=agent.agent_id,
+                agent_role=agent.agent_role,
+                message_content=message_content,
+                reasoning=str(entry.get("reasoning", "")),
+                confidence_score=min(max(confidence, 0.0), 1.0),
+            )
+        )
+    return messages
+
+
+def _get_llm_client(request: Request) -> LLMClient:
+    """Retrieve the shared LLMClient from app.state."""
+    client: LLMClient | None = getattr(request.app.state, "_llm_client", None)
+    if client is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "code": "LLM_UNAVAILABLE",
+                "message": "LLM client is not initialised",
+            },
+        )
+    return client
+
+
+def _round_cache_key(body: GenerateMessagesRequest) -> str:
+    """Canonical hash of everything that shapes a round's output."""
+    raw = json.dumps(
+        {
+            "topic": body.topic,
+            "agents": sorted(
+                (a.agent_id, a.agent_role, a.agent_name) for a in body.agents
+            ),
+            "previous_messages": body.previous_messages,
+            "round_number": body.round_number,
+            "start_sequence_order": body.start_sequence_order,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _round_cache_get(key: str) -> GenerateMessagesResponse | None:
+    """Return a cached round within TTL (evicting it when expired)."""
+    entry = _round_cache.get(key)
+    if entry is None:
+        return None
+    cached_at, response = entry
+    if time.monotonic() - cached_at > _ROUND_CACHE_TTL_S:
+        _round_cache.pop(key, None)
+        return None
+    return response
+
+
+def _round_cache_put(key: str, response: GenerateMessagesResponse) -> None:
+    """Cache a generated round (evicting the oldest entry when full)."""
+    if len(_round_cache) >= _ROUND_CACHE_MAX:
+        oldest = min(_round_cache, key=lambda k: _round_cache[k][0])
+        _round_cache.pop(oldest, None)
+    _round_cache[key] = (time.monotonic(), response)
 
 
 # ---------------------------------------------------------------------------
@@ -259,6 +424,7 @@ def _has_llm_keys(settings: Settings) -> bool:
     summary="Generate a round of AI debate messages",
 )
 async def generate_debate_messages(
+    request: Request,
     body: GenerateMessagesRequest,
     settings: Settings = Depends(get_settings),
 ) -> BaseResponse[GenerateMessagesResponse]:
@@ -279,9 +445,28 @@ async def generate_debate_messages(
     messages: list[GeneratedMessage] = []
     llm_used = False
 
-    if _has_llm_keys(settings):
-        # Use real LLM
-        llm_client = LLMClient(_settings=settings)
+    # Shared by both the simulation branch and the per-agent LLM fallback.
+    rendered_templates = _render_simulation_templates(body.topic)
+
+    # Bound prompt size: only the recent history tail shapes the next round.
+    history = body.previous_messages[-_MAX_HISTORY_MSGS:]
+    if len(body.previous_messages) > _MAX_HISTORY_MSGS:
+        logger.info(
+            "Debate history truncated: %d -> %d messages",
+            len(body.previous_messages),
+            _MAX_HISTORY_MSGS,
+        )
+
+    if settings.has_llm_keys:
+        cache_key = _round_cache_key(body)
+        cached = _round_cache_get(cache_key)
+        cache_stats.record("debate_round_exact", hit=cached is not None)
+        if cached is not None:
+            return BaseResponse(data=cached, meta={"source": "exact-cache"})
+
+        # Use the shared client so HTTP keep-alive to the provider survives
+        # across requests instead of rebuilding connection pools each call.
+        llm_client = _get_llm_client(request)
         llm_used = True
 
         # Determine which provider/model to use
@@ -292,14 +477,57 @@ async def generate_debate_messages(
             model_provider = "openai"
             model = "gpt-4o-mini"
 
+        # One batched call first: the topic/context is sent once instead of
+        # per agent, and fixed per-call overhead is paid once. Any parse or
+        # provider failure falls back to the per-agent fan-out below.
+        roles = sorted({a.agent_role for a in body.agents})
+        batch_row: dict[str, object] = {
+            "model_provider": model_provider,
+            "model": model,
+            "system_prompt": _build_batch_system_prompt(roles),
+            "parameters": {
+                "temperature": 0.8,
+                "max_tokens": min(8192, 1024 * len(body.agents)),
+                "top_p": 0.95,
+            },
+        }
+        try:
+            batch_response: LLMResponse = await llm_client.invoke(
+                batch_row,
+                [{"role": "user", "content": _build_batch_user_prompt(body, history)}],
+            )
+            batch_messages = _parse_batch_response(batch_response.content, body.agents)
+        except HTTPException:
+            logger.warning("Batched debate invocation failed; using per-agent path")
+            batch_messages = None
+
+        if batch_messages is not None:
+            response = GenerateMessagesResponse(
+                messages=batch_messages,
+                round_number=body.round_number,
+                llm_used=True,
+            )
+            _round_cache_put(cache_key, response)
+            return BaseResponse(data=response, meta={"mode": "batched"})
+
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_LLM_CALLS)
+
+        # Agents sharing a role build byte-identical prompts; invoke once
+        # per unique prompt pair and clone the result across the group.
+        prompt_groups: dict[tuple[str, str], list[DebateAgent]] = {}
         for agent in body.agents:
             system_prompt = _ROLE_SYSTEM_PROMPTS.get(
                 agent.agent_role, _ROLE_SYSTEM_PROMPTS["realist"]
             )
             user_prompt = _build_user_prompt(
-                body.topic, agent, body.previous_messages, body.round_number,
+                body.topic, agent, history, body.round_number,
             )
+            prompt_groups.setdefault((system_prompt, user_prompt), []).append(agent)
 
+        async def _invoke_one(
+            system_prompt: str, user_prompt: str, agent: DebateAgent
+        ) -> tuple[GeneratedMessage, bool]:
+            """Generate one agent's message; fall back to simulation on failure."""
             agent_row: dict[str, object] = {
                 "model_provider": model_provider,
                 "model": model,
@@ -312,21 +540,23 @@ async def generate_debate_messages(
             }
 
             try:
-                llm_response: LLMResponse = await llm_client.invoke(
-                    agent_row,
-                    [{"role": "user", "content": user_prompt}],
-                )
+                async with semaphore:
+                    llm_response: LLMResponse = await llm_client.invoke(
+                        agent_row,
+                        [{"role": "user", "content": user_prompt}],
+                    )
                 message_content, reasoning, confidence = _parse_llm_response(
                     llm_response.content,
                 )
-                messages.append(
+                return (
                     GeneratedMessage(
                         agent_id=agent.agent_id,
                         agent_role=agent.agent_role,
                         message_content=message_content,
                         reasoning=reasoning,
                         confidence_score=confidence,
-                    )
+                    ),
+                    True,
                 )
             except HTTPException:
                 # LLM provider error -- fall back to simulation for this agent
@@ -338,31 +568,47 @@ async def generate_debate_messages(
                     f"Debate LLM fallback: agent={agent.agent_id}",
                     level="warning",
                 )
-                messages.append(
-                    _generate_simulation_message(
-                        body.topic, agent, body.previous_messages, body.round_number,
-                    )
-                )
-                llm_used = False
             except Exception as exc:
                 logger.exception(
                     "Unexpected error generating debate message for agent %s",
                     agent.agent_id,
                 )
                 sentry_sdk.capture_exception(exc)
-                messages.append(
-                    _generate_simulation_message(
-                        body.topic, agent, body.previous_messages, body.round_number,
-                    )
+            return (
+                _generate_simulation_message(
+                    rendered_templates, agent, history, body.round_number,
+                ),
+                False,
+            )
+
+        # One call per unique prompt; groups are independent, so fan out.
+        group_results = await asyncio.gather(
+            *(
+                _invoke_one(system_prompt, user_prompt, agents[0])
+                for (system_prompt, user_prompt), agents in prompt_groups.items()
+            )
+        )
+
+        # Distribute each group's message to its members, then restore
+        # body.agents order.
+        by_agent_id: dict[str, GeneratedMessage] = {}
+        llm_used = True
+        for (_, agents), (message, used) in zip(
+            prompt_groups.items(), group_results, strict=True
+        ):
+            llm_used = llm_used and used
+            for agent in agents:
+                by_agent_id[agent.agent_id] = message.model_copy(
+                    update={"agent_id": agent.agent_id}
                 )
-                llm_used = False
+        messages = [by_agent_id[agent.agent_id] for agent in body.agents]
     else:
         # No LLM keys -- full simulation mode
         logger.info("No LLM keys configured; using simulation mode for debate")
         for agent in body.agents:
             messages.append(
                 _generate_simulation_message(
-                    body.topic, agent, body.previous_messages, body.round_number,
+                    rendered_templates, agent, history, body.round_number,
                 )
             )
 
@@ -372,4 +618,9 @@ async def generate_debate_messages(
         llm_used=llm_used,
     )
 
+    # Only fully LLM-generated rounds are worth replaying; simulation
+    # fallbacks are cheap to regenerate and intentionally randomized.
+    if llm_used:
+        _round_cache_put(cache_key, response)
+
     return BaseResponse(data=response)
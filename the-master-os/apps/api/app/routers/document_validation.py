@@ -15,18 +15,29 @@ Validation pipeline (triggered on upload):
 from __future__ import annotations
 
 import asyncio
+import base64
+import hashlib
 import logging
-import re
-from datetime import datetime
-from typing import Literal
+import time
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Literal
+from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from pydantic import BaseModel, Field
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from app.config import Settings, get_settings
+from app.deps.supabase import get_shared_supabase
+from app.llm import cache_stats
 from app.middleware.auth import AuthenticatedUser, get_current_user
 from app.schemas.common import BaseResponse, PaginatedResponse
 
+if TYPE_CHECKING:
+    from app.llm.client import LLMClient
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/orchestrate/documents", tags=["document-validation"])
@@ -43,6 +54,45 @@ _ALLOWED_EXTENSIONS = frozenset({
 
 _MAX_FILE_SIZE_MB = 50
 
+# Rendered once: the joined/sorted forms are recomputed per upload otherwise.
+_ALLOWED_EXT_DISPLAY = ", ".join(sorted(_ALLOWED_EXTENSIONS))
+
+# Types that stay on the synchronous LLM path even in llm_batch_mode —
+# bid deadlines make their reviews latency-critical.
+_URGENT_TYPES = frozenset({"입찰참가신청서", "bid_application"})
+
+# Short-TTL cache of filtered list totals: count="exact" forces a full
+# filtered count scan per page fetch, and the total barely moves between
+# consecutive page loads. 30s of staleness is acceptable for a listing UI.
+_COUNT_CACHE_TTL_S = 30.0
+_COUNT_CACHE_MAX = 1024
+_count_cache: dict[tuple[str, str | None, str | None], tuple[float, int]] = {}
+
+# Exact-match cache of LLM compliance verdicts: re-uploads of the same
+# document repeat the identical prompt, so the (status, issues) verdict is
+# kept for a day. Bump the version constant whenever the prompt changes.
+_COMPLIANCE_PROMPT_VERSION = 1
+_COMPLIANCE_CACHE_TTL_S = 86_400.0
+_COMPLIANCE_CACHE_MAX = 512
+_compliance_cache: dict[
+    str, tuple[float, tuple[str, list[dict[str, str | None]]]]
+] = {}
+
+# Short-TTL response cache for the read endpoints: polling/refreshing UIs
+# re-issue identical GETs far more often than the data changes. Writes in
+# this module invalidate the affected workspace's entries eagerly.
+_READ_CACHE_TTL_S = 5.0
+_READ_CACHE_MAX = 1024
+_read_cache: dict[tuple[str, ...], tuple[float, object]] = {}
+
+# Explicit projection matching DocumentReviewResponse — select("*") also
+# dragged along any columns the API never returns.
+_REVIEW_COLUMNS = (
+    "id, workspace_id, pipeline_execution_id, document_name, document_type, "
+    "file_url, status, issues, reviewer_notes, gdrive_file_id, "
+    "created_at, updated_at"
+)
+
 # Document type → required fields for compliance
 _REQUIRED_FIELDS_BY_TYPE: dict[str, list[str]] = {
     "사업자등록증": ["사업자등록번호", "상호", "대표자"],
@@ -54,6 +104,10 @@ _REQUIRED_FIELDS_BY_TYPE: dict[str, list[str]] = {
     "입찰참가신청서": ["공고번호", "업체명", "입찰금액"],
     "bid_application": ["공고번호", "업체명", "입찰금액"],
 }
+_REQUIRED_FIELDS_DISPLAY: dict[str, str] = {
+    doc_type: ", ".join(fields)
+    for doc_type, fields in _REQUIRED_FIELDS_BY_TYPE.items()
+}
 
 _LLM_COMPLIANCE_SYSTEM_PROMPT = """당신은 조달 입찰 문서를 검토하는 전문 검증 에이전트입니다.
 주어진 문서 정보를 분석하여 다음을 판단하세요:
@@ -75,16 +129,233 @@ _LLM_COMPLIANCE_SYSTEM_PROMPT = """당신은 조달 입찰 문서를 검토하
 주의: issues가 비어있으면 approved, critical/error 이슈가 있으면 rejected로 판단하세요.
 """
 
+# Compliance checks always run the same pseudo agent; building these
+# dicts (and an LLMClient) per invocation was wasted allocation and, for
+# the client, a fresh SDK connection pool each time.
+_ANTHROPIC_AGENT_ROW: dict[str, object] = {
+    "model_provider": "anthropic",
+    "model": "claude-haiku-3-20250310",
+    "system_prompt": _LLM_COMPLIANCE_SYSTEM_PROMPT,
+    "parameters": {"temperature": 0.2, "max_tokens": 2048},
+}
+_OPENAI_AGENT_ROW: dict[str, object] = {
+    "model_provider": "openai",
+    "model": "gpt-4o-mini",
+    "system_prompt": _LLM_COMPLIANCE_SYSTEM_PROMPT,
+    "parameters": {"temperature": 0.2, "max_tokens": 2048},
+}
+
+
+# LLMClient's httpx pools (and asyncio.Semaphore waiters below) are bound
+# to the event loop that created them. The API server only ever runs one
+# loop, but the in-process Celery fallback runs each task under its own
+# asyncio.run() loop — a process-wide client would hand a later task
+# keep-alive connections bound to an earlier task's closed loop. Both
+# caches are therefore keyed by the running loop, pruning closed loops
+# on miss so long-lived workers don't accumulate dead entries.
+_compliance_llm_clients: dict[asyncio.AbstractEventLoop, LLMClient] = {}
+
+
+def _compliance_llm_client() -> LLMClient:
+    """Per-event-loop LLMClient for compliance checks (lazy SDK clients inside)."""
+    from app.llm.client import LLMClient  # noqa: WPS433
+
+    loop = asyncio.get_running_loop()
+    client = _compliance_llm_clients.get(loop)
+    if client is None:
+        for stale in [cached for cached in _compliance_llm_clients if cached.is_closed()]:
+            _compliance_llm_clients.pop(stale, None)
+        client = LLMClient(_settings=get_settings())
+        _compliance_llm_clients[loop] = client
+    return client
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def _supabase_client(settings: Settings):  # noqa: ANN202
-    from supabase import create_client  # noqa: WPS433
+def _read_cache_get(key: tuple[str, ...]) -> object | None:
+    """Return a cached response, or None when absent/expired."""
+    entry = _read_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, value = entry
+    if time.monotonic() - stored_at > _READ_CACHE_TTL_S:
+        _read_cache.pop(key, None)
+        return None
+    return value
+
+
+def _read_cache_put(key: tuple[str, ...], value: object) -> None:
+    """Store a response, evicting the oldest entry when full."""
+    if len(_read_cache) >= _READ_CACHE_MAX:
+        oldest = min(_read_cache, key=lambda k: _read_cache[k][0])
+        _read_cache.pop(oldest, None)
+    _read_cache[key] = (time.monotonic(), value)
+
+
+# Singleflight map for get_review: concurrent requests for the same hot
+# review share one DB round-trip instead of racing N identical queries.
+_inflight_reviews: dict[str, asyncio.Future[object]] = {}
+
+
+def _invalidate_review_cache(workspace_id: str, review_id: str | None = None) -> None:
+    """Drop cached reads touched by a write to this workspace/review."""
+    for key in [k for k in _read_cache if k[0] == "list" and k[1] == workspace_id]:
+        _read_cache.pop(key, None)
+    if review_id is not None:
+        _read_cache.pop(("detail", review_id), None)
+
 
-    return create_client(settings.supabase_url, settings.supabase_service_role_key)
+# Sequential paging is the dominant pattern; speculatively warming page
+# N+1 hides its DB latency behind the user's read of page N.
+_PREFETCH_SEMAPHORE = asyncio.Semaphore(4)
+
+# Singleflight map for compliance checks: concurrent uploads of the same
+# document share one provider call instead of racing past the verdict
+# cache (same pattern as _inflight_reviews above).
+_inflight_compliance: dict[
+    str, asyncio.Future[tuple[str, list[dict[str, str | None]]]]
+] = {}
+
+# Backpressure for inline compliance checks: an upload burst queues here
+# instead of fanning out unbounded concurrent provider calls. Keyed by
+# the running loop for the same reason as _compliance_llm_clients above.
+_llm_semaphores: dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+
+def _get_llm_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _llm_semaphores.get(loop)
+    if semaphore is None:
+        for stale in [cached for cached in _llm_semaphores if cached.is_closed()]:
+            _llm_semaphores.pop(stale, None)
+        semaphore = asyncio.Semaphore(get_settings().llm_max_concurrency)
+        _llm_semaphores[loop] = semaphore
+    return semaphore
+
+
+async def _prefetch_next_page(
+    workspace_id: str,
+    page: int,
+    limit: int,
+    review_status: str | None,
+    document_type: str | None,
+    total: int,
+) -> None:
+    """Warm the read cache with the next list page; failures stay silent."""
+    key = _list_cache_key(workspace_id, page, limit, review_status, document_type)
+    if _read_cache_get(key) is not None:
+        return
+    async with _PREFETCH_SEMAPHORE:
+        try:
+            sb = get_shared_supabase()
+            offset = (page - 1) * limit
+            query = (
+                sb.table("document_reviews")
+                .select(_REVIEW_COLUMNS)
+                .eq("workspace_id", workspace_id)
+            )
+            if review_status:
+                query = query.eq("status", review_status)
+            if document_type:
+                query = query.eq("document_type", document_type)
+            result = await run_in_threadpool(
+                query.order("created_at", desc=True)
+                .range(offset, offset + limit - 1)
+                .execute
+            )
+            items = _REVIEW_LIST_ADAPTER.validate_python(result.data or [])
+            rows = result.data or []
+            next_cursor = (
+                _encode_cursor(str(rows[-1]["created_at"]), str(rows[-1]["id"]))
+                if len(rows) == limit
+                else None
+            )
+            _read_cache_put(
+                key,
+                _PAGE_ADAPTER.dump_python(
+                    PaginatedResponse(
+                        data=items,
+                        total=total,
+                        page=page,
+                        limit=limit,
+                        next_cursor=next_cursor,
+                    ),
+                    mode="json",
+                ),
+            )
+        except Exception:
+            logger.debug(
+                "Prefetch of review page %d failed", page, exc_info=True
+            )
+
+
+def _list_cache_key(
+    workspace_id: str,
+    page: int,
+    limit: int,
+    review_status: str | None,
+    document_type: str | None,
+    cursor: str | None = None,
+) -> tuple[str, ...]:
+    """Read-cache key for one list page — shared by handler and prefetch."""
+    return (
+        "list",
+        workspace_id,
+        str(page),
+        str(limit),
+        review_status or "",
+        document_type or "",
+        cursor or "",
+    )
+
+
+def _encode_cursor(created_at: str, review_id: str) -> str:
+    """Pack the last row's (created_at, id) into an opaque keyset cursor."""
+    raw = f"{created_at}\x00{review_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[str, str]:
+    """Unpack a keyset cursor; reject anything malformed with a 400."""
+    try:
+        created_at, _, review_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().partition("\x00")
+        )
+        if not created_at or not review_id:
+            raise ValueError("incomplete cursor")
+        # Both fields are interpolated into a PostgREST or_() filter string,
+        # so accept nothing looser than a real UUID and ISO-8601 timestamp.
+        UUID(review_id)
+        datetime.fromisoformat(created_at)
+        return created_at, review_id
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "INVALID_CURSOR", "message": "Malformed pagination cursor."},
+        ) from exc
+
+
+def _cached_count_get(key: tuple[str, str | None, str | None]) -> int | None:
+    """Return a cached list total, or None when absent/expired."""
+    entry = _count_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, total = entry
+    if time.monotonic() - stored_at > _COUNT_CACHE_TTL_S:
+        _count_cache.pop(key, None)
+        return None
+    return total
+
+
+def _cached_count_put(key: tuple[str, str | None, str | None], total: int) -> None:
+    """Store a list total, evicting the oldest entry when full."""
+    if len(_count_cache) >= _COUNT_CACHE_MAX:
+        oldest = min(_count_cache, key=lambda k: _count_cache[k][0])
+        _count_cache.pop(oldest, None)
+    _count_cache[key] = (time.monotonic(), total)
 
 
 # ---------------------------------------------------------------------------
@@ -93,13 +364,35 @@ def _supabase_client(settings: Settings):  # noqa: ANN202
 
 
 class IssueItem(BaseModel):
+    # Frozen: issue items are built once (validation or model_construct
+    # from our own DB writes) and never mutated afterwards.
+    model_config = ConfigDict(frozen=True)
+
     code: str
     severity: Literal["info", "warning", "error", "critical"] = "warning"
     message: str
     field: str | None = None
 
 
+class _ComplianceVerdict(BaseModel):
+    """Schema the provider is forced to satisfy for compliance checks."""
+
+    status: Literal["approved", "rejected", "reviewing"]
+    issues: list[IssueItem] = Field(default_factory=list)
+
+
+# Passed to LLMClient.invoke(json_schema=...) so the provider returns
+# schema-valid JSON (Anthropic tool call / OpenAI response_format) and a
+# paid call can never be lost to a parse failure.
+_COMPLIANCE_SCHEMA = _ComplianceVerdict.model_json_schema()
+
+
 class DocumentReviewResponse(BaseModel):
+    # Rows come straight from the DB; extra columns (from a widened
+    # projection or migration) must be dropped, never validated. Frozen —
+    # responses are read-only once built.
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     id: str
     workspace_id: str
     pipeline_execution_id: str | None
@@ -110,8 +403,27 @@ class DocumentReviewResponse(BaseModel):
     issues: list[IssueItem]
     reviewer_notes: str | None
     gdrive_file_id: str | None
-    created_at: datetime
-    updated_at: datetime
+    # Kept as ISO-8601 strings: PostgREST already returns RFC 3339 text,
+    # so parsing to datetime just to re-serialize it is wasted CPU per row.
+    created_at: str
+    updated_at: str
+
+
+# Precompiled so a whole page of rows is validated in one pydantic-core
+# pass instead of per-field Python construction per row.
+_REVIEW_LIST_ADAPTER: TypeAdapter[list[DocumentReviewResponse]] = TypeAdapter(
+    list[DocumentReviewResponse]
+)
+
+# Issue arrays validate in one pydantic-core pass rather than a Python
+# loop of per-item constructions.
+_ISSUE_LIST_ADAPTER: TypeAdapter[list[IssueItem]] = TypeAdapter(list[IssueItem])
+
+# list_reviews serializes through this adapter and returns the bytes
+# directly, skipping FastAPI's response_model re-validation pass.
+_PAGE_ADAPTER: TypeAdapter[PaginatedResponse[DocumentReviewResponse]] = TypeAdapter(
+    PaginatedResponse[DocumentReviewResponse]
+)
 
 
 class DocumentUploadRequest(BaseModel):
@@ -138,8 +450,10 @@ class DocumentReviewUpdate(BaseModel):
 
 @router.get(
     "/reviews",
-    response_model=PaginatedResponse[DocumentReviewResponse],
     summary="List document reviews",
+    # Schema documented via responses= — the handler returns pre-serialized
+    # bytes, so FastAPI must not re-validate through response_model.
+    responses={200: {"model": PaginatedResponse[DocumentReviewResponse]}},
 )
 async def list_reviews(
     workspace_id: str,
@@ -147,16 +461,32 @@ async def list_reviews(
     limit: int = Query(20, ge=1, le=100),
     review_status: str | None = Query(None, alias="status"),
     document_type: str | None = Query(None),
+    cursor: str | None = Query(
+        None, description="Opaque keyset cursor from a previous page's next_cursor"
+    ),
     user: AuthenticatedUser = Depends(get_current_user),
-    settings: Settings = Depends(get_settings),
-) -> PaginatedResponse[DocumentReviewResponse]:
-    """Paginated list of document reviews for a workspace."""
-    sb = _supabase_client(settings)
+) -> ORJSONResponse:
+    """Paginated list of document reviews for a workspace.
+
+    Passing ``cursor`` switches from OFFSET to keyset pagination on
+    (created_at, id), which stays O(limit) on deep pages.
+    """
+    read_key = _list_cache_key(
+        workspace_id, page, limit, review_status, document_type, cursor
+    )
+    cached_page = _read_cache_get(read_key)
+    if cached_page is not None:
+        return ORJSONResponse(cached_page)
+
+    sb = get_shared_supabase()
     offset = (page - 1) * limit
 
+    count_key = (workspace_id, review_status, document_type)
+    cached_total = _cached_count_get(count_key)
+
     query = (
         sb.table("document_reviews")
-        .select("*", count="exact")
+        .select(_REVIEW_COLUMNS, count=None if cached_total is not None else "exact")
         .eq("workspace_id", workspace_id)
     )
     if review_status:
@@ -164,14 +494,55 @@ async def list_reviews(
     if document_type:
         query = query.eq("document_type", document_type)
 
-    result = (
-        query.order("created_at", desc=True)
-        .range(offset, offset + limit - 1)
-        .execute()
+    if cursor:
+        cursor_ts, cursor_id = _decode_cursor(cursor)
+        query = (
+            query.or_(
+                f'created_at.lt."{cursor_ts}",'
+                f'and(created_at.eq."{cursor_ts}",id.lt.{cursor_id})'
+            )
+            .order("created_at", desc=True)
+            .order("id", desc=True)
+            .limit(limit)
+        )
+    else:
+        query = (
+            query.order("created_at", desc=True)
+            .order("id", desc=True)
+            .range(offset, offset + limit - 1)
+        )
+
+    result = await run_in_threadpool(query.execute)
+
+    if cached_total is not None:
+        total = cached_total
+    else:
+        total = result.count or 0
+        _cached_count_put(count_key, total)
+
+    rows = result.data or []
+    items = _REVIEW_LIST_ADAPTER.validate_python(rows)
+    next_cursor = (
+        _encode_cursor(str(rows[-1]["created_at"]), str(rows[-1]["id"]))
+        if len(rows) == limit
+        else None
     )
+    payload = _PAGE_ADAPTER.dump_python(
+        PaginatedResponse(
+            data=items, total=total, page=page, limit=limit, next_cursor=next_cursor
+        ),
+        mode="json",
+    )
+    _read_cache_put(read_key, payload)
+
+    if cursor is None and len(items) == limit and page * limit < total:
+        asyncio.create_task(
+            _prefetch_next_page(
+                workspace_id, page + 1, limit, review_status, document_type, total
+            )
+        )
 
-    items = [_row_to_review(row) for row in (result.data or [])]
-    return PaginatedResponse(data=items, total=result.count or 0, page=page, limit=limit)
+    return ORJSONResponse(payload)
 
 
 # ---------------------------------------------------------------------------
@@ -187,71 +558,58 @@ async def list_reviews(
 )
 async def upload_document(
     body: DocumentUploadRequest,
+    response: Response,
     user: AuthenticatedUser = Depends(get_current_user),
-    settings: Settings = Depends(get_settings),
 ) -> BaseResponse[DocumentReviewResponse]:
-    """Create a document review record and trigger the async validation pipeline.
-
-    Pipeline stages:
-      1. Insert record with status='pending'
-      2. Fire-and-forget background task:
-         a) Format validation (extension, size, required fields)
-         b) LLM compliance check (if anthropic/openai key configured)
-         c) Update status to 'approved' or 'rejected' with issues
+    """Acknowledge a document upload and run everything else in the background.
+
+    The request path does no DB work at all: we pre-generate the review
+    id, hand the atomic insert (``create_review_with_audit``, migration
+    20260228600010) plus the validation pipeline to the dispatcher, and
+    answer with a synthesized 'pending' row. The detail cache is seeded
+    with that row so an immediate GET-by-id on this process is served
+    before the insert lands; other readers may briefly 404, which the
+    async review model already tolerates.
     """
-    sb = _supabase_client(settings)
-
-    insert_data: dict[str, object] = {
-        "workspace_id": body.workspace_id,
-        "document_name": body.document_name,
-        "document_type": body.document_type,
-        "file_url": body.file_url,
-        "status": "pending",
-        "issues": [],
-    }
-
-    result = sb.table("document_reviews").insert(insert_data).execute()
+    review_id = str(uuid4())
+    now = datetime.now(tz=UTC).isoformat()
+
+    review = DocumentReviewResponse.model_construct(
+        id=review_id,
+        workspace_id=body.workspace_id,
+        pipeline_execution_id=None,
+        document_name=body.document_name,
+        document_type=body.document_type,
+        file_url=body.file_url,
+        status="pending",
+        issues=[],
+        reviewer_notes=None,
+        gdrive_file_id=None,
+        created_at=now,
+        updated_at=now,
+    )
 
-    if not result.data:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"code": "DB_ERROR", "message": "Failed to create document review."},
-        )
+    # --- Insert + validation pipeline dispatch ---
+    # With a broker configured the whole thing runs in the Celery worker
+    # pool: it survives API restarts, retries transient failures, and
+    # keeps both the insert and the multi-second LLM wait off this event
+    # loop. Without one, fall back to the in-process task.
+    _dispatch_validation(
+        review_id=review_id,
+        document_name=body.document_name,
+        document_type=body.document_type,
+        file_url=body.file_url,
+        workspace_id=body.workspace_id,
+        user_id=user.user_id,
+    )
 
-    row = result.data[0]
+    _invalidate_review_cache(body.workspace_id)
 
-    # Audit log
-    try:
-        sb.table("audit_logs").insert(
-            {
-                "workspace_id": body.workspace_id,
-                "user_id": user.user_id,
-                "action": "documents.upload",
-                "resource_type": "document_review",
-                "resource_id": str(row["id"]),
-                "details": {
-                    "document_name": body.document_name,
-                    "document_type": body.document_type,
-                },
-                "severity": "info",
-            }
-        ).execute()
-    except Exception:
-        logger.warning("Failed to write document upload audit log", exc_info=True)
+    ack = BaseResponse(data=review)
+    _read_cache_put(("detail", review_id), ack)
 
-    # --- Fire-and-forget: async validation pipeline ---
-    asyncio.create_task(
-        _run_validation_pipeline(
-            review_id=str(row["id"]),
-            document_name=body.document_name,
-            document_type=body.document_type,
-            file_url=body.file_url,
-            workspace_id=body.workspace_id,
-            settings=settings,
-        )
-    )
-
-    return BaseResponse(data=_row_to_review(row))
+    response.headers["Cache-Control"] = "no-store"
+    return ack
 
 
 # ---------------------------------------------------------------------------
@@ -267,26 +625,50 @@ async def upload_document(
 async def get_review(
     review_id: str,
     user: AuthenticatedUser = Depends(get_current_user),
-    settings: Settings = Depends(get_settings),
 ) -> BaseResponse[DocumentReviewResponse]:
     """Retrieve a single document review by ID."""
-    sb = _supabase_client(settings)
+    read_key = ("detail", review_id)
+    cached_detail = _read_cache_get(read_key)
+    if cached_detail is not None:
+        return cached_detail  # type: ignore[return-value]
 
-    result = (
-        sb.table("document_reviews")
-        .select("*")
-        .eq("id", review_id)
-        .limit(1)
-        .execute()
-    )
+    pending = _inflight_reviews.get(review_id)
+    if pending is not None:
+        return await asyncio.shield(pending)  # type: ignore[return-value]
 
-    if not result.data:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={"code": "NOT_FOUND", "message": f"Document review '{review_id}' not found."},
+    future: asyncio.Future[object] = asyncio.get_running_loop().create_future()
+    _inflight_reviews[review_id] = future
+    try:
+        sb = get_shared_supabase()
+
+        result = await run_in_threadpool(
+            sb.table("document_reviews")
+            .select(_REVIEW_COLUMNS)
+            .eq("id", review_id)
+            .limit(1)
+            .execute
         )
 
-    return BaseResponse(data=_row_to_review(result.data[0]))
+        if not result.data:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "code": "NOT_FOUND",
+                    "message": f"Document review '{review_id}' not found.",
+                },
+            )
+
+        detail_response = BaseResponse(data=_row_to_review(result.data[0]))
+        _read_cache_put(read_key, detail_response)
+        future.set_result(detail_response)
+        return detail_response
+    except BaseException as exc:
+        future.set_exception(exc)
+        # Consume the exception so an unawaited future never warns.
+        future.exception()
+        raise
+    finally:
+        _inflight_reviews.pop(review_id, None)
 
 
 # ---------------------------------------------------------------------------
@@ -302,21 +684,22 @@ async def get_review(
 async def update_review(
     review_id: str,
     body: DocumentReviewUpdate,
+    response: Response,
     user: AuthenticatedUser = Depends(get_current_user),
-    settings: Settings = Depends(get_settings),
 ) -> BaseResponse[DocumentReviewResponse]:
-    """Update the status, issues, or notes of a document review."""
-    sb = _supabase_client(settings)
-
-    update_data: dict[str, object] = {}
-    if body.status is not None:
-        update_data["status"] = body.status
-    if body.reviewer_notes is not None:
-        update_data["reviewer_notes"] = body.reviewer_notes
-    if body.issues is not None:
-        update_data["issues"] = [issue.model_dump() for issue in body.issues]
-    if body.gdrive_file_id is not None:
-        update_data["gdrive_file_id"] = body.gdrive_file_id
+    """Update the status, issues, or notes of a document review.
+
+    The column update and its audit-log entry run inside the
+    ``update_review_with_audit`` RPC (migration 20260228600009) in a
+    single transaction.
+    """
+    sb = get_shared_supabase()
+
+    # exclude_none mirrors the previous per-field "is not None" gating;
+    # agent_id is metric metadata, never a document_reviews column.
+    update_data: dict[str, object] = body.model_dump(
+        mode="json", exclude_none=True, exclude={"agent_id"}
+    )
 
     if not update_data:
         raise HTTPException(
@@ -324,11 +707,16 @@ async def update_review(
             detail={"code": "NO_UPDATE", "message": "No fields to update."},
         )
 
-    result = (
-        sb.table("document_reviews")
-        .update(update_data)
-        .eq("id", review_id)
-        .execute()
+    result = await run_in_threadpool(
+        sb.rpc("update_review_with_audit", {
+            "p_review_id": review_id,
+            "p_status": update_data.get("status"),
+            "p_reviewer_notes": update_data.get("reviewer_notes"),
+            "p_issues": update_data.get("issues"),
+            "p_gdrive_file_id": update_data.get("gdrive_file_id"),
+            "p_user_id": user.user_id,
+            "p_audit_details": update_data,
+        }).execute
     )
 
     if not result.data:
@@ -337,22 +725,6 @@ async def update_review(
             detail={"code": "NOT_FOUND", "message": f"Document review '{review_id}' not found."},
         )
 
-    # Audit log
-    try:
-        sb.table("audit_logs").insert(
-            {
-                "workspace_id": str(result.data[0].get("workspace_id", "")),
-                "user_id": user.user_id,
-                "action": "documents.review.update",
-                "resource_type": "document_review",
-                "resource_id": review_id,
-                "details": update_data,
-                "severity": "info",
-            }
-        ).execute()
-    except Exception:
-        logger.warning("Failed to write document review update audit log", exc_info=True)
-
     # Record agent quality metric on final review status
     if body.status in ("approved", "rejected") and body.agent_id:
         try:
@@ -376,6 +748,11 @@ async def update_review(
                 exc_info=True,
             )
 
+    _invalidate_review_cache(
+        str(result.data[0].get("workspace_id", "")), review_id
+    )
+
+    response.headers["Cache-Control"] = "no-store"
     return BaseResponse(data=_row_to_review(result.data[0]))
 
 
@@ -384,6 +761,98 @@ async def update_review(
 # ---------------------------------------------------------------------------
 
 
+def _dispatch_validation(
+    review_id: str,
+    document_name: str,
+    document_type: str,
+    file_url: str | None,
+    workspace_id: str,
+    user_id: str | None,
+) -> None:
+    """Queue the review insert + validation durably via Celery, or in-process."""
+    from app.worker import get_celery_app
+
+    celery_app = get_celery_app()
+    if celery_app is not None:
+        try:
+            celery_app.send_task(  # type: ignore[attr-defined]
+                "app.worker.tasks.create_and_validate_document",
+                kwargs={
+                    "review_id": review_id,
+                    "document_name": document_name,
+                    "document_type": document_type,
+                    "file_url": file_url,
+                    "workspace_id": workspace_id,
+                    "user_id": user_id,
+                },
+            )
+            return
+        except Exception:
+            logger.warning(
+                "Celery dispatch failed for review=%s; running in-process",
+                review_id,
+                exc_info=True,
+            )
+
+    asyncio.create_task(
+        _persist_review_and_validate(
+            review_id=review_id,
+            document_name=document_name,
+            document_type=document_type,
+            file_url=file_url,
+            workspace_id=workspace_id,
+            user_id=user_id,
+            settings=get_settings(),
+        )
+    )
+
+
+async def _persist_review_and_validate(
+    review_id: str,
+    document_name: str,
+    document_type: str,
+    file_url: str | None,
+    workspace_id: str,
+    user_id: str | None,
+    settings: Settings,
+) -> None:
+    """Insert the acknowledged review row, then run the validation pipeline.
+
+    The insert and its audit entry commit atomically via the
+    ``create_review_with_audit`` RPC; if it fails the acknowledged id
+    never materializes, so log loudly and skip validation.
+    """
+    sb = get_shared_supabase()
+    try:
+        await run_in_threadpool(
+            sb.rpc("create_review_with_audit", {
+                "p_id": review_id,
+                "p_workspace_id": workspace_id,
+                "p_document_name": document_name,
+                "p_document_type": document_type,
+                "p_file_url": file_url,
+                "p_user_id": user_id,
+            }).execute
+        )
+    except Exception:
+        logger.error(
+            "Deferred review insert failed: review=%s workspace=%s",
+            review_id,
+            workspace_id,
+            exc_info=True,
+        )
+        return
+
+    await _run_validation_pipeline(
+        review_id=review_id,
+        document_name=document_name,
+        document_type=document_type,
+        file_url=file_url,
+        workspace_id=workspace_id,
+        settings=settings,
+    )
+
+
 async def _run_validation_pipeline(
     review_id: str,
     document_name: str,
@@ -395,19 +864,18 @@ async def _run_validation_pipeline(
     """Execute the document validation pipeline as a background task.
 
     Stages:
-      1. Update status to 'reviewing'
-      2. Format validation (extension, size heuristic, required fields)
-      3. LLM compliance check (if API key available)
-      4. Update final status + issues
+      1. Format validation (extension, size heuristic, required fields)
+      2. LLM compliance check (if API key available)
+      3. Status update with final status + issues
+
+    Format validation is in-process and fast, so the intermediate
+    'reviewing' marker is only written when a slow inline LLM call will
+    follow; the other paths go straight from 'pending' to their terminal
+    write, halving the UPDATE round-trips.
     """
-    sb = _supabase_client(settings)
+    sb = get_shared_supabase()
 
     try:
-        # Stage 0: Mark as reviewing
-        sb.table("document_reviews").update(
-            {"status": "reviewing"}
-        ).eq("id", review_id).execute()
-
         issues: list[dict[str, str | None]] = []
 
         # Stage 1: Format validation
@@ -421,7 +889,46 @@ async def _run_validation_pipeline(
         # Stage 2: LLM compliance check (optional — graceful if no key)
         llm_available = bool(settings.anthropic_api_key or settings.openai_api_key)
 
+        if (
+            llm_available
+            and settings.llm_batch_mode
+            and settings.anthropic_api_key
+            and document_type not in _URGENT_TYPES
+        ):
+            # Batch mode: queue the check for the Message Batches flusher
+            # (half cost, no RPM pressure) and leave the review in
+            # 'reviewing' with the format issues until results land.
+            await run_in_threadpool(
+                sb.table("llm_compliance_queue").insert({
+                    "review_id": review_id,
+                    "workspace_id": workspace_id,
+                    "document_name": document_name,
+                    "document_type": document_type,
+                    "file_url": file_url,
+                    "format_issues": issues,
+                }).execute
+            )
+            await run_in_threadpool(
+                sb.table("document_reviews").update({
+                    "status": "reviewing",
+                    "issues": issues,
+                }).eq("id", review_id).execute
+            )
+            _invalidate_review_cache(workspace_id, review_id)
+            logger.info(
+                "Compliance check queued for batch: review=%s type=%s",
+                review_id,
+                document_type,
+            )
+            return
+
         if llm_available:
+            # Mark as reviewing while the slow LLM call is in flight.
+            await run_in_threadpool(
+                sb.table("document_reviews").update(
+                    {"status": "reviewing"}
+                ).eq("id", review_id).execute
+            )
             llm_result = await _run_llm_compliance_check(
                 document_name=document_name,
                 document_type=document_type,
@@ -460,10 +967,13 @@ async def _run_validation_pipeline(
                 final_status = "reviewing"
 
         # Stage 3: Update DB with results
-        sb.table("document_reviews").update({
-            "status": final_status,
-            "issues": issues,
-        }).eq("id", review_id).execute()
+        await run_in_threadpool(
+            sb.table("document_reviews").update({
+                "status": final_status,
+                "issues": issues,
+            }).eq("id", review_id).execute
+        )
+        _invalidate_review_cache(workspace_id, review_id)
 
         logger.info(
             "Validation pipeline completed: review=%s status=%s issues=%d llm=%s",
@@ -482,15 +992,17 @@ async def _run_validation_pipeline(
         )
         # Ensure the record doesn't stay in 'pending' forever
         try:
-            sb.table("document_reviews").update({
-                "status": "reviewing",
-                "issues": [{
-                    "code": "PIPELINE_ERROR",
-                    "severity": "warning",
-                    "message": f"자동 검증 중 오류 발생. 수동 검토 필요: {exc}",
-                    "field": None,
-                }],
-            }).eq("id", review_id).execute()
+            await run_in_threadpool(
+                sb.table("document_reviews").update({
+                    "status": "reviewing",
+                    "issues": [{
+                        "code": "PIPELINE_ERROR",
+                        "severity": "warning",
+                        "message": f"자동 검증 중 오류 발생. 수동 검토 필요: {exc}",
+                        "field": None,
+                    }],
+                }).eq("id", review_id).execute
+            )
         except Exception:
             logger.error(
                 "Failed to update review status after pipeline error: review=%s",
@@ -511,17 +1023,18 @@ def _validate_format(
     """
     issues: list[dict[str, str | None]] = []
 
-    # Check file extension
-    ext_match = re.search(r"\.\w+$", document_name.lower())
-    if ext_match:
-        extension = ext_match.group(0)
+    # Check file extension — rpartition beats a regex scan here and only
+    # lowercases the tail instead of the whole name.
+    _, sep, tail = document_name.rpartition(".")
+    if sep and tail.isalnum():
+        extension = "." + tail.lower()
         if extension not in _ALLOWED_EXTENSIONS:
             issues.append({
                 "code": "INVALID_EXTENSION",
                 "severity": "error",
                 "message": (
                     f"허용되지 않는 파일 확장자입니다: '{extension}'. "
-                    f"허용 확장자: {', '.join(sorted(_ALLOWED_EXTENSIONS))}"
+                    f"허용 확장자: {_ALLOWED_EXT_DISPLAY}"
                 ),
                 "field": "document_name",
             })
@@ -552,14 +1065,14 @@ def _validate_format(
         })
 
     # Check required fields for known document types
-    required_fields = _REQUIRED_FIELDS_BY_TYPE.get(document_type)
+    required_fields = _REQUIRED_FIELDS_DISPLAY.get(document_type)
     if required_fields:
         issues.append({
             "code": "REQUIRED_FIELDS_NOTE",
             "severity": "info",
             "message": (
                 f"문서 유형 '{document_type}'의 필수 항목: "
-                f"{', '.join(required_fields)}. 수동 확인 필요."
+                f"{required_fields}. 수동 확인 필요."
             ),
             "field": None,
         })
@@ -567,6 +1080,99 @@ def _validate_format(
     return issues
 
 
+def _compliance_cache_key(
+    model: str, document_name: str, document_type: str, file_url: str | None
+) -> str:
+    """Canonical hash of everything that shapes a compliance verdict."""
+    raw = "\x00".join(
+        (
+            model,
+            str(_COMPLIANCE_PROMPT_VERSION),
+            document_type,
+            document_name,
+            file_url or "",
+        )
+    )
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _compliance_cache_get(
+    key: str,
+) -> tuple[str, list[dict[str, str | None]]] | None:
+    """Return a cached verdict, or None when absent/expired."""
+    entry = _compliance_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, verdict = entry
+    if time.monotonic() - stored_at > _COMPLIANCE_CACHE_TTL_S:
+        _compliance_cache.pop(key, None)
+        return None
+    return verdict
+
+
+def _compliance_cache_put(
+    key: str, verdict: tuple[str, list[dict[str, str | None]]]
+) -> None:
+    """Store a verdict, evicting the oldest entry when full."""
+    if len(_compliance_cache) >= _COMPLIANCE_CACHE_MAX:
+        oldest = min(_compliance_cache, key=lambda k: _compliance_cache[k][0])
+        _compliance_cache.pop(oldest, None)
+    _compliance_cache[key] = (time.monotonic(), verdict)
+
+
+def _parse_compliance_content(
+    content: str,
+) -> tuple[str, list[dict[str, str | None]]]:
+    """Parse the compliance JSON an LLM returned into (status, issues).
+
+    Shared by the synchronous check below and the batch flusher; raises
+    orjson.JSONDecodeError on malformed payloads.
+    """
+    content = content.strip()
+    # Strip markdown code fence if present
+    if content.startswith("```"):
+        content = content.removeprefix("```json").removeprefix("```").strip()
+        if content.endswith("```"):
+            content = content[:-3].rstrip()
+
+    parsed = orjson.loads(content)
+    llm_status = str(parsed.get("status", "reviewing"))
+    raw_issues = parsed.get("issues", [])
+
+    llm_issues: list[dict[str, str | None]] = []
+    if isinstance(raw_issues, list):
+        for issue in raw_issues:
+            if isinstance(issue, dict):
+                llm_issues.append({
+                    "code": str(issue.get("code", "LLM_ISSUE")),
+                    "severity": str(issue.get("severity", "warning")),
+                    "message": str(issue.get("message", "")),
+                    "field": issue.get("field"),
+                })
+    return llm_status, llm_issues
+
+
+def _build_compliance_user_message(
+    document_name: str,
+    document_type: str,
+    file_url: str | None,
+    format_issues: list[dict[str, str | None]],
+) -> str:
+    """Compose the user message for a compliance check (shared with batching)."""
+    format_issues_summary = (
+        orjson.dumps(format_issues).decode() if format_issues else "없음"
+    )
+    return (
+        f"다음 문서를 검증해주세요:\n\n"
+        f"- 문서명: {document_name}\n"
+        f"- 문서 유형: {document_type}\n"
+        f"- 파일 URL: {file_url or '미제공'}\n"
+        f"- 형식 검증 결과: {format_issues_summary}\n\n"
+        f"위 정보를 바탕으로 문서의 적합성을 판단하고, "
+        f"JSON 형식으로 응답해주세요."
+    )
+
+
 async def _run_llm_compliance_check(
     document_name: str,
     document_type: str,
@@ -579,78 +1185,67 @@ async def _run_llm_compliance_check(
     Returns:
         (status, issues_list) or None if LLM invocation fails.
     """
-    import json  # noqa: WPS433
-
     try:
-        from app.llm.client import LLMClient  # noqa: WPS433
+        llm_client = _compliance_llm_client()
 
-        llm_client = LLMClient(_settings=settings)
-
-        # Build a pseudo agent row for the LLM client
         # Prefer Anthropic if available, fallback to OpenAI
-        if settings.anthropic_api_key:
-            agent_row: dict[str, object] = {
-                "model_provider": "anthropic",
-                "model": "claude-haiku-3-20250310",
-                "system_prompt": _LLM_COMPLIANCE_SYSTEM_PROMPT,
-                "parameters": {"temperature": 0.2, "max_tokens": 2048},
-            }
-        else:
-            agent_row = {
-                "model_provider": "openai",
-                "model": "gpt-4o-mini",
-                "system_prompt": _LLM_COMPLIANCE_SYSTEM_PROMPT,
-                "parameters": {"temperature": 0.2, "max_tokens": 2048},
-            }
-
-        # Compose user message with document context
-        format_issues_summary = json.dumps(format_issues, ensure_ascii=False) if format_issues else "없음"
-        user_message = (
-            f"다음 문서를 검증해주세요:\n\n"
-            f"- 문서명: {document_name}\n"
-            f"- 문서 유형: {document_type}\n"
-            f"- 파일 URL: {file_url or '미제공'}\n"
-            f"- 형식 검증 결과: {format_issues_summary}\n\n"
-            f"위 정보를 바탕으로 문서의 적합성을 판단하고, "
-            f"JSON 형식으로 응답해주세요."
+        agent_row = (
+            _ANTHROPIC_AGENT_ROW if settings.anthropic_api_key else _OPENAI_AGENT_ROW
         )
 
-        messages = [{"role": "user", "content": user_message}]
-        response = await llm_client.invoke(agent_row, messages)
-
-        # Parse LLM response (expected JSON)
-        content = response.content.strip()
-        # Strip markdown code fence if present
-        if content.startswith("```"):
-            content = re.sub(r"^```(?:json)?\s*", "", content)
-            content = re.sub(r"\s*```$", "", content)
-
-        parsed = json.loads(content)
-        llm_status = str(parsed.get("status", "reviewing"))
-        raw_issues = parsed.get("issues", [])
-
-        llm_issues: list[dict[str, str | None]] = []
-        if isinstance(raw_issues, list):
-            for issue in raw_issues:
-                if isinstance(issue, dict):
-                    llm_issues.append({
-                        "code": str(issue.get("code", "LLM_ISSUE")),
-                        "severity": str(issue.get("severity", "warning")),
-                        "message": str(issue.get("message", "")),
-                        "field": issue.get("field"),
-                    })
+        cache_key = _compliance_cache_key(
+            str(agent_row["model"]), document_name, document_type, file_url
+        )
+        cached_verdict = _compliance_cache_get(cache_key)
+        cache_stats.record("compliance_exact", hit=cached_verdict is not None)
+        if cached_verdict is not None:
+            logger.info(
+                "LLM compliance verdict served from cache for %s", document_name
+            )
+            return cached_verdict
 
-        logger.info(
-            "LLM compliance check completed: status=%s issues=%d model=%s cost=%.6f",
-            llm_status,
-            len(llm_issues),
-            response.model,
-            response.cost,
+        pending = _inflight_compliance.get(cache_key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[tuple[str, list[dict[str, str | None]]]] = (
+            asyncio.get_running_loop().create_future()
         )
+        _inflight_compliance[cache_key] = future
+        try:
+            # Compose user message with document context
+            user_message = _build_compliance_user_message(
+                document_name, document_type, file_url, format_issues
+            )
+
+            messages = [{"role": "user", "content": user_message}]
+            async with _get_llm_semaphore():
+                response = await llm_client.invoke(
+                    agent_row, messages, json_schema=_COMPLIANCE_SCHEMA
+                )
 
-        return llm_status, llm_issues
+            llm_status, llm_issues = _parse_compliance_content(response.content)
+            _compliance_cache_put(cache_key, (llm_status, llm_issues))
+
+            logger.info(
+                "LLM compliance check completed: status=%s issues=%d model=%s cost=%.6f",
+                llm_status,
+                len(llm_issues),
+                response.model,
+                response.cost,
+            )
 
-    except json.JSONDecodeError as exc:
+            future.set_result((llm_status, llm_issues))
+            return llm_status, llm_issues
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Consume the exception so an unawaited future never warns.
+            future.exception()
+            raise
+        finally:
+            _inflight_compliance.pop(cache_key, None)
+
+    except orjson.JSONDecodeError as exc:
         logger.warning(
             "LLM returned non-JSON response for compliance check: %s", exc
         )
@@ -668,32 +1263,30 @@ async def _run_llm_compliance_check(
 
 
 def _row_to_review(row: dict[str, object]) -> DocumentReviewResponse:
-    """Convert a raw Supabase row to a DocumentReviewResponse."""
-    raw_issues = row.get("issues") or []
-    issues: list[IssueItem] = []
-    if isinstance(raw_issues, list):
-        for item in raw_issues:
-            if isinstance(item, dict):
-                issues.append(
-                    IssueItem(
-                        code=str(item.get("code", "UNKNOWN")),
-                        severity=str(item.get("severity", "warning")),  # type: ignore[arg-type]
-                        message=str(item.get("message", "")),
-                        field=item.get("field"),  # type: ignore[arg-type]
-                    )
-                )
+    """Build a DocumentReviewResponse from a raw Supabase row.
 
-    return DocumentReviewResponse(
+    Rows come from our own writes, so the schema is trusted:
+    model_construct skips pydantic validation entirely; the timestamps
+    pass through as the ISO strings PostgREST returned. Single-row paths
+    only — list pages go through the batched TypeAdapter above.
+    """
+    raw_issues = row.get("issues") or []
+    issues = (
+        _ISSUE_LIST_ADAPTER.validate_python(raw_issues)
+        if isinstance(raw_issues, list)
+        else []
+    )
+    return DocumentReviewResponse.model_construct(
         id=str(row["id"]),
-        workspace_id=str(row["workspace_id"]),
-        pipeline_execution_id=str(row["pipeline_execution_id"]) if row.get("pipeline_execution_id") else None,
-        document_name=str(row["document_name"]),
-        document_type=str(row.get("document_type", "general")),
-        file_url=str(row["file_url"]) if row.get("file_url") else None,
-        status=str(row.get("status", "pending")),
+        workspace_id=str(row.get("workspace_id") or ""),
+        pipeline_execution_id=row.get("pipeline_execution_id"),
+        document_name=str(row.get("document_name") or ""),
+        document_type=str(row.get("document_type") or "general"),
+        file_url=row.get("file_url"),
+        status=str(row.get("status") or "pending"),
         issues=issues,
-        reviewer_notes=str(row["reviewer_notes"]) if row.get("reviewer_notes") else None,
-        gdrive_file_id=str(row["gdrive_file_id"]) if row.get("gdrive_file_id") else None,
-        created_at=datetime.fromisoformat(str(row["created_at"])),
-        updated_at=datetime.fromisoformat(str(row["updated_at"])),
+        reviewer_notes=row.get("reviewer_notes"),
+        gdrive_file_id=row.get("gdrive_file_id"),
+        created_at=str(row["created_at"]),
+        updated_at=str(row["updated_at"]),
     )
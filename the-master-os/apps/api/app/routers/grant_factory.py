@@ -17,9 +17,11 @@ import re
 from typing import Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 
 from app.config import Settings, get_settings
+from app.deps.supabase import get_shared_supabase
 from app.mcp.base import MCPConnectionError, MCPExecutionError
 from app.middleware.auth import AuthenticatedUser, get_current_user
 from app.schemas.common import BaseResponse, PaginatedResponse
@@ -43,9 +45,8 @@ _SOURCE_URLS: dict[str, str] = {
 
 
 def _supabase_client(settings: Settings):  # noqa: ANN202
-    from supabase import create_client  # noqa: WPS433
-
-    return create_client(settings.supabase_url, settings.supabase_service_role_key)
+    """Return the process-wide pooled Supabase client (see app.deps.supabase)."""
+    return get_shared_supabase()
 
 
 async def _try_get_firecrawl_registry(
@@ -273,7 +274,7 @@ async def list_tenders(
     if status_filter:
         query = query.eq("status", status_filter)
 
-    result = query.execute()
+    result = await run_in_threadpool(query.execute)
     rows = result.data or []
     total = result.count or 0
 
@@ -408,26 +409,30 @@ async def trigger_crawl(
             )
         ]
 
-    # --- Upsert tenders into DB (deduplicate by tender_id per workspace) ---
-    inserted: list[TenderSubmission] = []
-    for tender in tender_rows:
-        existing = (
-            sb.table("tender_submissions")
-            .select("id")
-            .eq("workspace_id", body.workspace_id)
-            .eq("tender_id", str(tender["tender_id"]))
-            .execute()
-        )
-        if existing.data and len(existing.data) > 0:
-            continue
+    # --- Insert tenders into DB (deduplicate by tender_id per workspace) ---
+    # One batched existence check + one bulk insert instead of a
+    # SELECT + INSERT pair per tender (2N+1 round trips -> 2).
+    tender_ids = [str(tender["tender_id"]) for tender in tender_rows]
+    existing = await run_in_threadpool(
+        sb.table("tender_submissions")
+        .select("tender_id")
+        .eq("workspace_id", body.workspace_id)
+        .in_("tender_id", tender_ids)
+        .execute
+    )
+    existing_ids = {str(row["tender_id"]) for row in (existing.data or [])}
+    new_rows = [
+        tender
+        for tender in tender_rows
+        if str(tender["tender_id"]) not in existing_ids
+    ]
 
-        result = (
-            sb.table("tender_submissions")
-            .insert(tender)
-            .execute()
+    inserted: list[TenderSubmission] = []
+    if new_rows:
+        result = await run_in_threadpool(
+            sb.table("tender_submissions").insert(new_rows).execute
         )
-        if result.data:
-            inserted.append(TenderSubmission(**result.data[0]))
+        inserted = [TenderSubmission(**row) for row in (result.data or [])]
 
     source_label = "실시간 크롤링" if crawl_source == "live" else "시뮬레이션"
     response = CrawlResponse(
@@ -473,7 +478,7 @@ async def list_submissions(
     else:
         query = query.neq("status", "draft")
 
-    result = query.execute()
+    result = await run_in_threadpool(query.execute)
     rows = result.data or []
     total = result.count or 0
 
@@ -524,11 +529,11 @@ async def update_submission(
         user.user_id,
     )
 
-    result = (
+    result = await run_in_threadpool(
         sb.table("tender_submissions")
         .update(update_data)
         .eq("id", submission_id)
-        .execute()
+        .execute
     )
 
     if not result.data or len(result.data) == 0:
@@ -16,6 +16,7 @@ from fastapi import APIRouter, HTTPException, status
 from redis.asyncio import Redis as AsyncRedis
 
 from app.config import get_settings
+from app.llm import cache_stats
 from app.schemas.common import DetailedHealthResponse, HealthResponse, ServiceStatus
 
 logger = logging.getLogger(__name__)
@@ -37,6 +38,15 @@ async def health_check() -> HealthResponse:
     )
 
 
+@router.get(
+    "/metrics",
+    summary="In-process cache hit/miss counters",
+)
+async def cache_metrics() -> dict[str, dict[str, dict[str, int]]]:
+    """Expose LLM response-cache effectiveness counters."""
+    return {"llm_cache": cache_stats.snapshot()}
+
+
 @router.get(
     "/health/detailed",
     response_model=DetailedHealthResponse,
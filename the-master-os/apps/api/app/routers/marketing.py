@@ -29,6 +29,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from pydantic import BaseModel, EmailStr, Field
 
 from app.config import Settings, get_settings
+from app.deps.supabase import get_shared_supabase
 from app.middleware.auth import AuthenticatedUser, get_current_user
 from app.schemas.common import BaseResponse, PaginatedResponse
 
@@ -43,19 +44,16 @@ router = APIRouter(prefix="/orchestrate/marketing", tags=["marketing"])
 
 
 def _supabase_client(settings: Settings):  # noqa: ANN202
-    from supabase import create_client  # noqa: WPS433
-
-    return create_client(settings.supabase_url, settings.supabase_service_role_key)
+    """Return the process-wide pooled Supabase client (see app.deps.supabase)."""
+    return get_shared_supabase()
 
 
 def _mcp_registry(settings: Settings):  # noqa: ANN202
     """Build a minimal MCPRegistry for direct email dispatch."""
-    from supabase import create_client  # noqa: WPS433
-
     from app.mcp.registry import MCPRegistry
     from app.security.vault import SecretVault
 
-    sb = create_client(settings.supabase_url, settings.supabase_service_role_key)
+    sb = get_shared_supabase()
     vault = SecretVault(sb)
     return MCPRegistry(vault=vault, supabase_client=sb)
 
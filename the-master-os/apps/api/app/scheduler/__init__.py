@@ -10,6 +10,8 @@ Design:
   - Jobs:
     - ``vault_rotation_check`` — every 60 minutes
     - ``health_monitor_check`` — every 5 minutes
+    - ``healing_stats_refresh`` — every 10 minutes (rides the health scheduler)
+    - ``llm_batch_flush`` — every 2 minutes (only when LLM_BATCH_MODE is on)
   - Graceful degradation: if a scheduler fails to start, the API keeps running.
 """
 
@@ -30,6 +32,8 @@ _scheduler: AsyncIOScheduler | None = None
 _health_scheduler: AsyncIOScheduler | None = None
 _ROTATION_INTERVAL_MINUTES = 60
 _HEALTH_CHECK_INTERVAL_MINUTES = 5
+_STATS_REFRESH_INTERVAL_MINUTES = 10
+_LLM_BATCH_INTERVAL_MINUTES = 2
 
 
 async def init_vault_scheduler(supabase: SupabaseAsyncClient) -> AsyncIOScheduler | None:
@@ -85,7 +89,9 @@ async def init_health_monitor(
         logger.info("Health monitor scheduler disabled (ENABLE_SCHEDULER != true)")
         return None
 
+    from app.config import get_settings
     from app.scheduler.health_monitor import run_health_monitor
+    from app.scheduler.stats_refresh import run_stats_refresh
 
     scheduler = AsyncIOScheduler(timezone="UTC")
     scheduler.add_job(
@@ -102,6 +108,29 @@ async def init_health_monitor(
             "supabase_key": supabase_key,
         },
     )
+    scheduler.add_job(
+        run_stats_refresh,
+        trigger="interval",
+        minutes=_STATS_REFRESH_INTERVAL_MINUTES,
+        id="healing_stats_refresh",
+        max_instances=1,
+        replace_existing=True,
+        misfire_grace_time=120,
+        kwargs={"supabase": supabase},
+    )
+    if get_settings().llm_batch_mode:
+        from app.scheduler.llm_batch import run_llm_batch_flush
+
+        scheduler.add_job(
+            run_llm_batch_flush,
+            trigger="interval",
+            minutes=_LLM_BATCH_INTERVAL_MINUTES,
+            id="llm_batch_flush",
+            max_instances=1,
+            replace_existing=True,
+            misfire_grace_time=60,
+            kwargs={"supabase": supabase},
+        )
     scheduler.start()
     _health_scheduler = scheduler
     logger.info(
@@ -0,0 +1,194 @@
+"""LLM compliance batch flusher.
+
+When ``LLM_BATCH_MODE`` is enabled, non-urgent document uploads queue
+their compliance checks into ``llm_compliance_queue`` instead of calling
+the provider inline. This job (riding the health-monitor scheduler):
+
+  1. Polls batches already submitted to the Anthropic Message Batches
+     API; for each ended batch, applies the per-document verdicts to
+     ``document_reviews`` and marks the queue rows done.
+  2. Submits queued pending rows as a new batch (up to ``_MAX_BATCH_SIZE``
+     per run, custom_id = review_id).
+
+Message Batches cost half the synchronous price and are exempt from RPM
+limits; results typically land well within the scheduler interval.
+
+Error handling:
+  - Failures are logged and never propagated; rows stay 'pending' or
+    'submitted' and are retried on the next run.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from app.config import get_settings
+
+if TYPE_CHECKING:
+    from supabase._async.client import AsyncClient as SupabaseAsyncClient
+
+logger = logging.getLogger(__name__)
+
+_MAX_BATCH_SIZE = 100
+_BATCH_MODEL = "claude-haiku-3-20250310"
+
+
+def _anthropic_client():  # noqa: ANN202
+    from anthropic import AsyncAnthropic
+
+    return AsyncAnthropic(api_key=get_settings().anthropic_api_key)
+
+
+async def run_llm_batch_flush(supabase: SupabaseAsyncClient) -> None:
+    """Poll submitted compliance batches, then submit newly queued rows."""
+    try:
+        await _apply_finished_batches(supabase)
+        await _submit_pending_rows(supabase)
+    except Exception:
+        logger.warning("LLM compliance batch flush failed", exc_info=True)
+
+
+async def _apply_finished_batches(supabase: SupabaseAsyncClient) -> None:
+    """Fetch results for ended batches and update the reviews they cover."""
+    submitted = await (
+        supabase.table("llm_compliance_queue")
+        .select("batch_id")
+        .eq("status", "submitted")
+        .execute()
+    )
+    batch_ids = sorted({row["batch_id"] for row in (submitted.data or []) if row.get("batch_id")})
+    if not batch_ids:
+        return
+
+    client = _anthropic_client()
+    for batch_id in batch_ids:
+        batch = await client.messages.batches.retrieve(batch_id)
+        if batch.processing_status != "ended":
+            continue
+
+        # In the pinned SDK, AsyncBatches.results is an async def returning
+        # the JSONL decoder, so it must be awaited before iteration.
+        async for result in await client.messages.batches.results(batch_id):
+            review_id = result.custom_id
+            if result.result.type == "succeeded":
+                content = "".join(
+                    block.text
+                    for block in result.result.message.content
+                    if getattr(block, "type", "") == "text"
+                )
+                await _apply_verdict(supabase, review_id, content)
+            else:
+                logger.warning(
+                    "Batched compliance check failed: review=%s result=%s",
+                    review_id,
+                    result.result.type,
+                )
+            await (
+                supabase.table("llm_compliance_queue")
+                .update({"status": "done"})
+                .eq("review_id", review_id)
+                .eq("batch_id", batch_id)
+                .execute()
+            )
+        logger.info("Applied compliance batch %s", batch_id)
+
+
+async def _apply_verdict(
+    supabase: SupabaseAsyncClient, review_id: str, content: str
+) -> None:
+    """Merge one batched verdict into its document review."""
+    # Late imports keep router<->scheduler coupling one-directional at import time.
+    from app.routers.document_validation import (
+        _invalidate_review_cache,
+        _parse_compliance_content,
+    )
+
+    try:
+        llm_status, llm_issues = _parse_compliance_content(content)
+    except Exception:
+        logger.warning(
+            "Batched compliance verdict unparseable for review=%s", review_id
+        )
+        return
+
+    current = await (
+        supabase.table("document_reviews")
+        .select("workspace_id, issues")
+        .eq("id", review_id)
+        .limit(1)
+        .execute()
+    )
+    if not current.data:
+        return
+    row = current.data[0]
+    issues = list(row.get("issues") or []) + llm_issues
+    has_blocking = any(i.get("severity") in ("error", "critical") for i in issues)
+    final_status = "rejected" if has_blocking else llm_status
+
+    await (
+        supabase.table("document_reviews")
+        .update({"status": final_status, "issues": issues})
+        .eq("id", review_id)
+        .execute()
+    )
+    _invalidate_review_cache(str(row.get("workspace_id", "")), review_id)
+
+
+async def _submit_pending_rows(supabase: SupabaseAsyncClient) -> None:
+    """Bundle pending queue rows into one Message Batches submission."""
+    from app.routers.document_validation import (
+        _LLM_COMPLIANCE_SYSTEM_PROMPT,
+        _build_compliance_user_message,
+    )
+
+    pending = await (
+        supabase.table("llm_compliance_queue")
+        .select("review_id, document_name, document_type, file_url, format_issues")
+        .eq("status", "pending")
+        .order("created_at")
+        .limit(_MAX_BATCH_SIZE)
+        .execute()
+    )
+    rows = pending.data or []
+    if not rows:
+        return
+
+    requests = [
+        {
+            "custom_id": str(row["review_id"]),
+            "params": {
+                "model": _BATCH_MODEL,
+                "max_tokens": 2048,
+                "temperature": 0.2,
+                "system": _LLM_COMPLIANCE_SYSTEM_PROMPT,
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": _build_compliance_user_message(
+                            str(row["document_name"]),
+                            str(row["document_type"]),
+                            row.get("file_url"),
+                            list(row.get("format_issues") or []),
+                        ),
+                    }
+                ],
+            },
+        }
+        for row in rows
+    ]
+
+    client = _anthropic_client()
+    batch = await client.messages.batches.create(requests=requests)
+
+    review_ids = [str(row["review_id"]) for row in rows]
+    await (
+        supabase.table("llm_compliance_queue")
+        .update({"status": "submitted", "batch_id": batch.id})
+        .in_("review_id", review_ids)
+        .eq("status", "pending")
+        .execute()
+    )
+    logger.info(
+        "Submitted compliance batch %s with %d checks", batch.id, len(requests)
+    )
@@ -0,0 +1,35 @@
+"""Healing stats rollup refresh job.
+
+Runs every 10 minutes on the health-monitor scheduler and calls the
+``refresh_healing_stats_daily`` RPC, which executes
+``REFRESH MATERIALIZED VIEW CONCURRENTLY healing_stats_daily``
+(migration 20260228600006). GET /orchestrate/healing/stats sums this
+rollup for complete past days instead of re-scanning the incident table.
+
+Error handling:
+  - A failed refresh only means slightly staler rollup rows; it is logged
+    and never propagated (the next run retries).
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from supabase._async.client import AsyncClient as SupabaseAsyncClient
+
+logger = logging.getLogger(__name__)
+
+
+async def run_stats_refresh(supabase: SupabaseAsyncClient) -> None:
+    """Refresh the healing_stats_daily materialized view.
+
+    Args:
+        supabase: Async Supabase client instance.
+    """
+    try:
+        await supabase.rpc("refresh_healing_stats_daily", {}).execute()
+        logger.debug("healing_stats_daily refreshed")
+    except Exception:
+        logger.warning("healing_stats_daily refresh failed", exc_info=True)
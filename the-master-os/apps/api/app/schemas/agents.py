@@ -68,6 +68,9 @@ class TokenUsage(BaseModel):
 
     input_tokens: int = Field(..., ge=0)
     output_tokens: int = Field(..., ge=0)
+    cached_tokens: int = Field(
+        default=0, ge=0, description="Input tokens served from the provider prompt cache"
+    )
 
 
 class AgentInvokeResponse(BaseModel):
@@ -25,12 +25,17 @@ class BaseResponse(BaseModel, Generic[T]):
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
-    """Standard envelope for paginated list responses."""
+    """Standard envelope for paginated list responses.
+
+    ``next_cursor`` is set by endpoints that support keyset pagination;
+    pass it back as ``?cursor=`` to fetch the next page.
+    """
 
     data: list[T]
     total: int
     page: int
     limit: int
+    next_cursor: str | None = None
 
     model_config = {"from_attributes": True}
 
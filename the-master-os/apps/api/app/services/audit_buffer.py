@@ -0,0 +1,101 @@
+"""Buffered audit-log writes.
+
+Write endpoints enqueue audit rows instead of inserting them one at a
+time; a lifespan-started task drains the queue every 100ms (or sooner at
+100 rows) and issues a single bulk insert, so N concurrent writes cost
+one audit round-trip instead of N.
+
+Delivery semantics are at-most-once: rows still buffered when the
+process dies are lost, which is acceptable for severity=info audit
+entries (the primary writes they describe are already committed).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.deps.supabase import get_shared_supabase
+
+logger = logging.getLogger(__name__)
+
+_FLUSH_INTERVAL_S = 0.1
+_MAX_BATCH = 100
+# Bounded so a stalled flusher (DB outage) cannot grow the buffer without
+# limit; best-effort rows beyond the bound are dropped with a warning.
+_MAX_QUEUE = 10_000
+
+_queue: asyncio.Queue[dict[str, object]] = asyncio.Queue(maxsize=_MAX_QUEUE)
+_task: asyncio.Task[None] | None = None
+
+
+def enqueue_audit_log(payload: dict[str, object]) -> None:
+    """Queue one audit_logs row for the next batched insert.
+
+    Drops the row (with a warning) when the buffer is full — audit
+    entries are best-effort and must never block or fail the request.
+    """
+    try:
+        _queue.put_nowait(payload)
+    except asyncio.QueueFull:
+        logger.warning(
+            "Audit log buffer full (%d rows); dropping action=%s",
+            _MAX_QUEUE,
+            payload.get("action"),
+        )
+
+
+async def _flush(batch: list[dict[str, object]]) -> None:
+    """Bulk-insert one batch; failures are logged, never raised."""
+    try:
+        sb = get_shared_supabase()
+        await run_in_threadpool(sb.table("audit_logs").insert(batch).execute)
+    except Exception:
+        logger.warning(
+            "Failed to flush %d audit log rows", len(batch), exc_info=True
+        )
+
+
+async def _run() -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        # Block until at least one row arrives, then collect up to
+        # _MAX_BATCH rows for at most _FLUSH_INTERVAL_S before flushing.
+        batch = [await _queue.get()]
+        deadline = loop.time() + _FLUSH_INTERVAL_S
+        while len(batch) < _MAX_BATCH:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_queue.get(), timeout=timeout))
+            except TimeoutError:
+                break
+        await _flush(batch)
+
+
+def start_audit_buffer() -> None:
+    """Launch the flusher task (called once from the app lifespan)."""
+    global _task
+    if _task is None:
+        _task = asyncio.create_task(_run())
+        logger.info("Audit log buffer started")
+
+
+async def stop_audit_buffer() -> None:
+    """Cancel the flusher and write out anything still queued."""
+    global _task
+    if _task is not None:
+        _task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _task
+        _task = None
+
+    remaining: list[dict[str, object]] = []
+    while not _queue.empty():
+        remaining.append(_queue.get_nowait())
+    if remaining:
+        await _flush(remaining)
@@ -351,6 +351,50 @@ def cleanup_old_audit_logs() -> dict[str, Any]:
         return {"status": "error"}
 
 
+# ---------------------------------------------------------------------------
+# Task: create_and_validate_document
+# ---------------------------------------------------------------------------
+
+def create_and_validate_document(
+    review_id: str,
+    document_name: str,
+    document_type: str,
+    file_url: str | None,
+    workspace_id: str,
+    user_id: str | None,
+) -> dict[str, Any]:
+    """Insert an acknowledged review and run its validation pipeline.
+
+    Dispatched by ``POST /orchestrate/documents/upload`` when a broker is
+    configured: the endpoint has already answered with the pre-generated
+    ``review_id``, so this task persists the row (atomically with its
+    audit entry via the create_review_with_audit RPC) and then runs the
+    multi-second compliance check off the API event loop.
+
+    Raises on failure so Celery's retry policy applies; the insert is
+    idempotent in practice because a retry after a committed insert hits
+    the primary-key conflict and dead-letters instead of duplicating.
+    """
+    import asyncio
+
+    from app.config import get_settings
+    from app.routers.document_validation import _persist_review_and_validate
+
+    asyncio.run(
+        _persist_review_and_validate(
+            review_id=review_id,
+            document_name=document_name,
+            document_type=document_type,
+            file_url=file_url,
+            workspace_id=workspace_id,
+            user_id=user_id,
+            settings=get_settings(),
+        )
+    )
+    logger.info("create_and_validate_document: completed review=%s", review_id)
+    return {"status": "completed", "review_id": review_id}
+
+
 # ---------------------------------------------------------------------------
 # Register tasks with Celery (if available)
 # ---------------------------------------------------------------------------
@@ -377,6 +421,13 @@ def _register_celery_tasks() -> None:
         app.task(name="app.worker.tasks.cleanup_old_audit_logs", bind=False)(
             cleanup_old_audit_logs
         )
+        app.task(
+            name="app.worker.tasks.create_and_validate_document",
+            bind=False,
+            autoretry_for=(Exception,),
+            retry_backoff=True,
+            retry_kwargs={"max_retries": 3},
+        )(create_and_validate_document)
         logger.info("Celery tasks registered successfully")
     except Exception:
         logger.warning("Failed to register Celery tasks", exc_info=True)
@@ -0,0 +1,70 @@
+"""Unit tests for document-validation pagination helpers.
+
+Covers the keyset cursor encode/decode pair and the shared list
+read-cache key, without touching Supabase or the full app.
+"""
+
+from __future__ import annotations
+
+import base64
+
+import pytest
+from fastapi import HTTPException
+
+from app.routers.document_validation import (
+    _decode_cursor,
+    _encode_cursor,
+    _list_cache_key,
+)
+
+
+class TestCursorRoundTrip:
+    def test_encode_decode_round_trip(self) -> None:
+        created_at = "2026-08-27T10:00:00+00:00"
+        review_id = "11111111-2222-3333-4444-555555555555"
+
+        cursor = _encode_cursor(created_at, review_id)
+        assert _decode_cursor(cursor) == (created_at, review_id)
+
+    def test_rejects_non_base64_cursor(self) -> None:
+        with pytest.raises(HTTPException) as exc_info:
+            _decode_cursor("not a cursor!!")
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail["code"] == "INVALID_CURSOR"
+
+    def test_rejects_cursor_without_separator(self) -> None:
+        cursor = base64.urlsafe_b64encode(b"no-separator-here").decode()
+        with pytest.raises(HTTPException) as exc_info:
+            _decode_cursor(cursor)
+        assert exc_info.value.status_code == 400
+
+    def test_rejects_non_uuid_id(self) -> None:
+        # Decoded fields end up inside a PostgREST or_() filter string, so a
+        # crafted id like `x),id.gt.(y` must never survive decoding.
+        cursor = _encode_cursor("2026-08-27T10:00:00+00:00", 'x"),and(id.gt."y')
+        with pytest.raises(HTTPException) as exc_info:
+            _decode_cursor(cursor)
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail["code"] == "INVALID_CURSOR"
+
+    def test_rejects_non_timestamp_created_at(self) -> None:
+        cursor = _encode_cursor('not-a-timestamp"', "11111111-2222-3333-4444-555555555555")
+        with pytest.raises(HTTPException) as exc_info:
+            _decode_cursor(cursor)
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail["code"] == "INVALID_CURSOR"
+
+
+class TestListCacheKey:
+    def test_prefetch_key_matches_handler_key_without_cursor(self) -> None:
+        # The prefetch writer omits the cursor argument; the handler passes
+        # cursor=None on offset-paginated requests. Both must produce the
+        # same key or prefetched pages can never be served.
+        handler_key = _list_cache_key("ws-1", 2, 20, "pending", None, None)
+        prefetch_key = _list_cache_key("ws-1", 2, 20, "pending", None)
+        assert handler_key == prefetch_key
+
+    def test_cursor_produces_distinct_key(self) -> None:
+        base = _list_cache_key("ws-1", 1, 20, None, None)
+        with_cursor = _list_cache_key("ws-1", 1, 20, None, None, "abc")
+        assert base != with_cursor
@@ -0,0 +1,196 @@
+"""Unit tests for the LLM compliance batch flusher.
+
+Covers the apply/submit halves of the scheduler job with mocked
+Anthropic and Supabase clients. The fake batches client mirrors the
+pinned SDK, where ``AsyncBatches.results`` is an ``async def`` that
+returns the iterator — so these tests fail if the flusher ever goes
+back to iterating the coroutine itself.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+import pytest
+
+from app.scheduler import llm_batch
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+_REVIEW_ID = "11111111-2222-3333-4444-555555555555"
+
+
+def _make_query() -> MagicMock:
+    """One sync-chain/async-execute query mock (same shape as test_scheduler)."""
+    query = MagicMock()
+    query.execute = AsyncMock(return_value=MagicMock(data=[], count=0))
+    for method in ("select", "eq", "in_", "is_", "order", "limit", "update", "insert"):
+        getattr(query, method).return_value = query
+    return query
+
+
+@pytest.fixture
+def mock_supabase_batch() -> MagicMock:
+    """Async Supabase mock with one query chain per table name."""
+    client = MagicMock()
+    client.queries = {
+        "llm_compliance_queue": _make_query(),
+        "document_reviews": _make_query(),
+    }
+    client.table.side_effect = lambda name: client.queries[name]
+    return client
+
+
+def _fake_anthropic(batch_results: list[object], processing_status: str = "ended") -> MagicMock:
+    """Anthropic client mock matching the pinned SDK surface.
+
+    ``batches.results`` is an ``async def`` returning an async iterator,
+    not an async iterator itself.
+    """
+    client = MagicMock()
+    client.messages.batches.retrieve = AsyncMock(
+        return_value=SimpleNamespace(processing_status=processing_status)
+    )
+
+    async def results(batch_id: str):  # noqa: ANN202
+        async def _iterator():  # noqa: ANN202
+            for result in batch_results:
+                yield result
+
+        return _iterator()
+
+    client.messages.batches.results = results
+    client.messages.batches.create = AsyncMock(return_value=SimpleNamespace(id="batch-new"))
+    return client
+
+
+def _succeeded_result(review_id: str, verdict: dict[str, object]) -> SimpleNamespace:
+    text_block = SimpleNamespace(type="text", text=orjson.dumps(verdict).decode())
+    return SimpleNamespace(
+        custom_id=review_id,
+        result=SimpleNamespace(
+            type="succeeded",
+            message=SimpleNamespace(content=[text_block]),
+        ),
+    )
+
+
+# ---------------------------------------------------------------------------
+# _apply_finished_batches
+# ---------------------------------------------------------------------------
+
+
+class TestApplyFinishedBatches:
+    async def test_applies_verdict_and_marks_row_done(
+        self,
+        mock_supabase_batch: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        queue = mock_supabase_batch.queries["llm_compliance_queue"]
+        reviews = mock_supabase_batch.queries["document_reviews"]
+        queue.execute.return_value = MagicMock(data=[{"batch_id": "batch-1"}])
+        reviews.execute.return_value = MagicMock(
+            data=[{"workspace_id": "ws-1", "issues": []}]
+        )
+
+        verdict = {
+            "status": "approved",
+            "issues": [{"code": "X", "severity": "info", "message": "ok", "field": None}],
+        }
+        fake = _fake_anthropic([_succeeded_result(_REVIEW_ID, verdict)])
+        monkeypatch.setattr(llm_batch, "_anthropic_client", lambda: fake)
+
+        await llm_batch._apply_finished_batches(mock_supabase_batch)
+
+        reviews.update.assert_called_once()
+        updated = reviews.update.call_args.args[0]
+        assert updated["status"] == "approved"
+        assert updated["issues"][0]["code"] == "X"
+        queue.update.assert_called_once_with({"status": "done"})
+
+    async def test_skips_batches_still_processing(
+        self,
+        mock_supabase_batch: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        queue = mock_supabase_batch.queries["llm_compliance_queue"]
+        queue.execute.return_value = MagicMock(data=[{"batch_id": "batch-1"}])
+
+        fake = _fake_anthropic([], processing_status="in_progress")
+        monkeypatch.setattr(llm_batch, "_anthropic_client", lambda: fake)
+
+        await llm_batch._apply_finished_batches(mock_supabase_batch)
+
+        queue.update.assert_not_called()
+        mock_supabase_batch.queries["document_reviews"].update.assert_not_called()
+
+    async def test_failed_result_marks_row_done_without_verdict(
+        self,
+        mock_supabase_batch: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        queue = mock_supabase_batch.queries["llm_compliance_queue"]
+        queue.execute.return_value = MagicMock(data=[{"batch_id": "batch-1"}])
+
+        errored = SimpleNamespace(
+            custom_id=_REVIEW_ID, result=SimpleNamespace(type="errored")
+        )
+        fake = _fake_anthropic([errored])
+        monkeypatch.setattr(llm_batch, "_anthropic_client", lambda: fake)
+
+        await llm_batch._apply_finished_batches(mock_supabase_batch)
+
+        mock_supabase_batch.queries["document_reviews"].update.assert_not_called()
+        queue.update.assert_called_once_with({"status": "done"})
+
+
+# ---------------------------------------------------------------------------
+# _submit_pending_rows
+# ---------------------------------------------------------------------------
+
+
+class TestSubmitPendingRows:
+    async def test_submits_pending_rows_as_one_batch(
+        self,
+        mock_supabase_batch: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        queue = mock_supabase_batch.queries["llm_compliance_queue"]
+        queue.execute.return_value = MagicMock(
+            data=[
+                {
+                    "review_id": _REVIEW_ID,
+                    "document_name": "사업계획서.pdf",
+                    "document_type": "business_plan",
+                    "file_url": None,
+                    "format_issues": [],
+                }
+            ]
+        )
+
+        fake = _fake_anthropic([])
+        monkeypatch.setattr(llm_batch, "_anthropic_client", lambda: fake)
+
+        await llm_batch._submit_pending_rows(mock_supabase_batch)
+
+        requests = fake.messages.batches.create.call_args.kwargs["requests"]
+        assert requests[0]["custom_id"] == _REVIEW_ID
+        queue.update.assert_called_once_with(
+            {"status": "submitted", "batch_id": "batch-new"}
+        )
+
+    async def test_no_pending_rows_submits_nothing(
+        self,
+        mock_supabase_batch: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        fake = _fake_anthropic([])
+        monkeypatch.setattr(llm_batch, "_anthropic_client", lambda: fake)
+
+        await llm_batch._submit_pending_rows(mock_supabase_batch)
+
+        fake.messages.batches.create.assert_not_called()
@@ -0,0 +1,50 @@
+-- =============================================================================
+-- Migration: healing_stats RPC — push GET /orchestrate/healing/stats
+-- aggregation into Postgres (one indexed scan instead of shipping every
+-- incident row to the API and looping in Python)
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION healing_stats(p_workspace_id UUID, p_since TIMESTAMPTZ)
+RETURNS JSON AS $$
+  SELECT json_build_object(
+    'total_incidents', COUNT(*),
+    'auto_resolved', COUNT(*) FILTER (WHERE status = 'resolved'),
+    'active_incidents', COUNT(*) FILTER (
+      WHERE status IN ('detected', 'diagnosing', 'healing')
+    ),
+    'avg_recovery_seconds', COALESCE(
+      AVG(EXTRACT(EPOCH FROM (resolved_at - detected_at))) FILTER (
+        WHERE status = 'resolved'
+          AND resolved_at IS NOT NULL
+          AND resolved_at >= detected_at
+      ),
+      0
+    ),
+    'by_severity', COALESCE(
+      (
+        SELECT json_object_agg(severity, c)
+        FROM (
+          SELECT severity, COUNT(*) AS c
+          FROM healing_incidents
+          WHERE workspace_id = p_workspace_id AND detected_at >= p_since
+          GROUP BY severity
+        ) s
+      ),
+      '{}'::json
+    ),
+    'by_type', COALESCE(
+      (
+        SELECT json_object_agg(incident_type, c)
+        FROM (
+          SELECT incident_type, COUNT(*) AS c
+          FROM healing_incidents
+          WHERE workspace_id = p_workspace_id AND detected_at >= p_since
+          GROUP BY incident_type
+        ) t
+      ),
+      '{}'::json
+    )
+  )
+  FROM healing_incidents
+  WHERE workspace_id = p_workspace_id AND detected_at >= p_since;
+$$ LANGUAGE sql STABLE SECURITY DEFINER;
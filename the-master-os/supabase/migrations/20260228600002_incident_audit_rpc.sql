@@ -0,0 +1,87 @@
+-- =============================================================================
+-- Migration: transactional incident+audit RPCs — collapse the two-insert
+-- (or update+insert) write path of the healing endpoints into a single
+-- round-trip that commits both rows atomically
+-- =============================================================================
+
+-- Create a healing incident and its audit trail in one transaction.
+CREATE OR REPLACE FUNCTION create_incident_with_audit(
+    p_workspace_id       UUID,
+    p_incident_type      TEXT,
+    p_source_service     TEXT,
+    p_severity           TEXT,
+    p_resolution_details JSONB,
+    p_detected_at        TIMESTAMPTZ,
+    p_user_id            UUID
+)
+RETURNS SETOF healing_incidents AS $$
+DECLARE
+  v_incident healing_incidents;
+BEGIN
+  INSERT INTO healing_incidents (
+    workspace_id, incident_type, source_service, severity,
+    status, resolution_details, detected_at
+  )
+  VALUES (
+    p_workspace_id, p_incident_type, p_source_service, p_severity,
+    'detected', p_resolution_details, p_detected_at
+  )
+  RETURNING * INTO v_incident;
+
+  INSERT INTO audit_logs (
+    workspace_id, user_id, action, category,
+    resource_type, resource_id, details, severity
+  )
+  VALUES (
+    p_workspace_id, p_user_id, 'healing.trigger', 'healing',
+    'healing_incident', v_incident.id,
+    jsonb_build_object(
+      'source_service', p_source_service,
+      'incident_type', p_incident_type,
+      'severity', p_severity
+    ),
+    'warning'
+  );
+
+  RETURN NEXT v_incident;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- Update a healing incident and write its audit trail in one transaction.
+CREATE OR REPLACE FUNCTION resolve_incident_with_audit(
+    p_incident_id        UUID,
+    p_status             TEXT,
+    p_resolution_action  TEXT,
+    p_resolution_details JSONB,
+    p_resolved_at        TIMESTAMPTZ,
+    p_user_id            UUID,
+    p_audit_details      JSONB
+)
+RETURNS SETOF healing_incidents AS $$
+DECLARE
+  v_incident healing_incidents;
+BEGIN
+  UPDATE healing_incidents
+  SET status             = p_status,
+      resolution_action  = COALESCE(p_resolution_action, resolution_action),
+      resolution_details = COALESCE(p_resolution_details, resolution_details),
+      resolved_at        = COALESCE(p_resolved_at, resolved_at)
+  WHERE id = p_incident_id
+  RETURNING * INTO v_incident;
+
+  IF v_incident.id IS NULL THEN
+    RETURN;
+  END IF;
+
+  INSERT INTO audit_logs (
+    workspace_id, user_id, action, category,
+    resource_type, resource_id, details, severity
+  )
+  VALUES (
+    v_incident.workspace_id, p_user_id, 'healing.' || p_status, 'healing',
+    'healing_incident', v_incident.id, p_audit_details, 'info'
+  );
+
+  RETURN NEXT v_incident;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
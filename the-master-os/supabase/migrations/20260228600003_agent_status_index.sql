@@ -0,0 +1,9 @@
+-- =============================================================================
+-- Migration: composite index for GET /orchestrate/agent/{id}/status
+-- The latest-assignment lookup orders by created_at DESC per agent; without
+-- this index it degrades to a sort over all of the agent's assignments.
+-- healing_incidents already has idx_hi_workspace_detected (20260227200003).
+-- =============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_aa_agent_created
+    ON agent_assignments(agent_id, created_at DESC);
@@ -0,0 +1,9 @@
+-- =============================================================================
+-- Migration: composite index for keyset pagination on healing incidents
+-- GET /orchestrate/healing/incidents?cursor=... pages on (detected_at, id)
+-- descending; this index makes each page an O(limit) scan regardless of
+-- depth, replacing LIMIT/OFFSET row skipping.
+-- =============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_hi_workspace_detected_id
+    ON healing_incidents(workspace_id, detected_at DESC, id DESC);
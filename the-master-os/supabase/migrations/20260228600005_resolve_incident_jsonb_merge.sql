@@ -0,0 +1,47 @@
+-- =============================================================================
+-- Migration: merge resolution_details server-side in resolve_incident_with_audit
+-- The API no longer pre-fetches the incident to merge details in Python;
+-- the JSONB || merge happens in the UPDATE itself, making PATCH a single
+-- round-trip (missing id surfaces as an empty result).
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION resolve_incident_with_audit(
+    p_incident_id        UUID,
+    p_status             TEXT,
+    p_resolution_action  TEXT,
+    p_resolution_details JSONB,
+    p_resolved_at        TIMESTAMPTZ,
+    p_user_id            UUID,
+    p_audit_details      JSONB
+)
+RETURNS SETOF healing_incidents AS $$
+DECLARE
+  v_incident healing_incidents;
+BEGIN
+  UPDATE healing_incidents
+  SET status             = p_status,
+      resolution_action  = COALESCE(p_resolution_action, resolution_action),
+      resolution_details = CASE
+        WHEN p_resolution_details IS NULL THEN resolution_details
+        ELSE COALESCE(resolution_details, '{}'::jsonb) || p_resolution_details
+      END,
+      resolved_at        = COALESCE(p_resolved_at, resolved_at)
+  WHERE id = p_incident_id
+  RETURNING * INTO v_incident;
+
+  IF v_incident.id IS NULL THEN
+    RETURN;
+  END IF;
+
+  INSERT INTO audit_logs (
+    workspace_id, user_id, action, category,
+    resource_type, resource_id, details, severity
+  )
+  VALUES (
+    v_incident.workspace_id, p_user_id, 'healing.' || p_status, 'healing',
+    'healing_incident', v_incident.id, p_audit_details, 'info'
+  );
+
+  RETURN NEXT v_incident;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
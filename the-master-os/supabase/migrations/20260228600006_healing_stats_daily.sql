@@ -0,0 +1,112 @@
+-- =============================================================================
+-- Migration: daily rollup behind GET /orchestrate/healing/stats
+-- Dashboards poll the stats endpoint; even SQL-side aggregation scans up
+-- to a year of incidents per call. healing_stats_daily pre-aggregates per
+-- (workspace, day, severity, type, status); healing_stats() now sums the
+-- rollup for complete past days and scans live rows for today only, so a
+-- call touches O(days) rollup rows instead of O(incidents-in-window).
+-- The rollup is refreshed by the API's health-monitor scheduler via
+-- refresh_healing_stats_daily(); the window start is truncated to the day
+-- boundary, which is the granularity the endpoint exposes (days=N).
+-- =============================================================================
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS healing_stats_daily AS
+SELECT
+    workspace_id,
+    date_trunc('day', detected_at) AS day,
+    severity,
+    incident_type,
+    status,
+    COUNT(*) AS incident_count,
+    COUNT(*) FILTER (WHERE status = 'resolved') AS resolved_count,
+    COALESCE(
+        SUM(EXTRACT(EPOCH FROM (resolved_at - detected_at))) FILTER (
+            WHERE status = 'resolved'
+              AND resolved_at IS NOT NULL
+              AND resolved_at >= detected_at
+        ),
+        0
+    ) AS recovery_sum
+FROM healing_incidents
+GROUP BY 1, 2, 3, 4, 5;
+
+-- Required for REFRESH MATERIALIZED VIEW CONCURRENTLY.
+CREATE UNIQUE INDEX IF NOT EXISTS idx_hsd_unique
+    ON healing_stats_daily(workspace_id, day, severity, incident_type, status);
+
+CREATE OR REPLACE FUNCTION refresh_healing_stats_daily()
+RETURNS VOID AS $$
+BEGIN
+  REFRESH MATERIALIZED VIEW CONCURRENTLY healing_stats_daily;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE OR REPLACE FUNCTION healing_stats(p_workspace_id UUID, p_since TIMESTAMPTZ)
+RETURNS JSON AS $$
+  WITH combined AS (
+    -- Complete past days come from the rollup ...
+    SELECT severity, incident_type, status, incident_count, resolved_count, recovery_sum
+    FROM healing_stats_daily
+    WHERE workspace_id = p_workspace_id
+      AND day >= date_trunc('day', p_since)
+      AND day < date_trunc('day', now())
+    UNION ALL
+    -- ... today's (not yet rolled up) rows stay live.
+    SELECT
+        severity,
+        incident_type,
+        status,
+        COUNT(*),
+        COUNT(*) FILTER (WHERE status = 'resolved'),
+        COALESCE(
+            SUM(EXTRACT(EPOCH FROM (resolved_at - detected_at))) FILTER (
+                WHERE status = 'resolved'
+                  AND resolved_at IS NOT NULL
+                  AND resolved_at >= detected_at
+            ),
+            0
+        )
+    FROM healing_incidents
+    WHERE workspace_id = p_workspace_id
+      AND detected_at >= GREATEST(p_since, date_trunc('day', now()))
+    GROUP BY 1, 2, 3
+  )
+  SELECT json_build_object(
+    'total_incidents', COALESCE(SUM(incident_count), 0),
+    'auto_resolved', COALESCE(SUM(resolved_count), 0),
+    'active_incidents', COALESCE(
+      SUM(incident_count) FILTER (
+        WHERE status IN ('detected', 'diagnosing', 'healing')
+      ),
+      0
+    ),
+    'avg_recovery_seconds', CASE
+      WHEN COALESCE(SUM(resolved_count), 0) > 0
+        THEN SUM(recovery_sum) / SUM(resolved_count)
+      ELSE 0
+    END,
+    'by_severity', COALESCE(
+      (
+        SELECT json_object_agg(severity, c)
+        FROM (
+          SELECT severity, SUM(incident_count) AS c
+          FROM combined
+          GROUP BY severity
+        ) s
+      ),
+      '{}'::json
+    ),
+    'by_type', COALESCE(
+      (
+        SELECT json_object_agg(incident_type, c)
+        FROM (
+          SELECT incident_type, SUM(incident_count) AS c
+          FROM combined
+          GROUP BY incident_type
+        ) t
+      ),
+      '{}'::json
+    )
+  )
+  FROM combined;
+$$ LANGUAGE sql STABLE SECURITY DEFINER;
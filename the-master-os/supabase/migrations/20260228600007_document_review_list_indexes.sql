@@ -0,0 +1,15 @@
+-- =============================================================================
+-- Migration: composite indexes for the document-review list endpoint
+-- GET /orchestrate/documents/reviews filters on workspace_id (optionally
+-- plus status / document_type) and orders by created_at DESC, id DESC.
+-- Without a matching index every page is a filtered sort over the whole
+-- workspace; with these each page (OFFSET or keyset) is an index range
+-- scan + limit.
+-- =============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_dr_workspace_created_id
+    ON document_reviews(workspace_id, created_at DESC, id DESC);
+
+-- Status is the common secondary filter (pending/reviewing queues).
+CREATE INDEX IF NOT EXISTS idx_dr_workspace_status_created
+    ON document_reviews(workspace_id, status, created_at DESC, id DESC);
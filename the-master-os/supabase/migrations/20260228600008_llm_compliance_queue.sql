@@ -0,0 +1,26 @@
+-- =============================================================================
+-- Migration: queue table for batched LLM compliance checks
+-- With LLM_BATCH_MODE enabled, non-urgent document uploads park their
+-- compliance check here instead of calling the provider inline; the API's
+-- batch flusher bundles pending rows into Anthropic Message Batches
+-- submissions (status pending -> submitted -> done) and writes verdicts
+-- back to document_reviews.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS llm_compliance_queue (
+    id            UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    review_id     UUID NOT NULL REFERENCES document_reviews(id) ON DELETE CASCADE,
+    workspace_id  UUID NOT NULL,
+    document_name TEXT NOT NULL,
+    document_type TEXT NOT NULL,
+    file_url      TEXT,
+    format_issues JSONB NOT NULL DEFAULT '[]'::jsonb,
+    status        TEXT NOT NULL DEFAULT 'pending'
+                  CHECK (status IN ('pending', 'submitted', 'done')),
+    batch_id      TEXT,
+    created_at    TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- The flusher scans by status: pending rows to submit, submitted rows to poll.
+CREATE INDEX IF NOT EXISTS idx_lcq_status_created
+    ON llm_compliance_queue(status, created_at);
@@ -0,0 +1,85 @@
+-- =============================================================================
+-- Migration: transactional review+audit RPCs — collapse the two-write
+-- path of the document review endpoints (review row + audit_logs row)
+-- into a single round-trip that commits both atomically, mirroring the
+-- healing-incident RPCs in 20260228600002
+-- =============================================================================
+
+-- Create a document review and its audit trail in one transaction.
+CREATE OR REPLACE FUNCTION create_review_with_audit(
+    p_workspace_id  UUID,
+    p_document_name TEXT,
+    p_document_type TEXT,
+    p_file_url      TEXT,
+    p_user_id       UUID
+)
+RETURNS SETOF document_reviews AS $$
+DECLARE
+  v_review document_reviews;
+BEGIN
+  INSERT INTO document_reviews (
+    workspace_id, document_name, document_type, file_url, status, issues
+  )
+  VALUES (
+    p_workspace_id, p_document_name, p_document_type, p_file_url,
+    'pending', '[]'::jsonb
+  )
+  RETURNING * INTO v_review;
+
+  INSERT INTO audit_logs (
+    workspace_id, user_id, action, category,
+    resource_type, resource_id, details, severity
+  )
+  VALUES (
+    p_workspace_id, p_user_id, 'documents.upload', 'documents',
+    'document_review', v_review.id,
+    jsonb_build_object(
+      'document_name', p_document_name,
+      'document_type', p_document_type
+    ),
+    'info'
+  );
+
+  RETURN NEXT v_review;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- Update a document review and write its audit trail in one transaction.
+-- NULL params leave the corresponding column untouched (PATCH semantics).
+CREATE OR REPLACE FUNCTION update_review_with_audit(
+    p_review_id      UUID,
+    p_status         TEXT,
+    p_reviewer_notes TEXT,
+    p_issues         JSONB,
+    p_gdrive_file_id TEXT,
+    p_user_id        UUID,
+    p_audit_details  JSONB
+)
+RETURNS SETOF document_reviews AS $$
+DECLARE
+  v_review document_reviews;
+BEGIN
+  UPDATE document_reviews
+  SET status         = COALESCE(p_status, status),
+      reviewer_notes = COALESCE(p_reviewer_notes, reviewer_notes),
+      issues         = COALESCE(p_issues, issues),
+      gdrive_file_id = COALESCE(p_gdrive_file_id, gdrive_file_id)
+  WHERE id = p_review_id
+  RETURNING * INTO v_review;
+
+  IF v_review.id IS NULL THEN
+    RETURN;
+  END IF;
+
+  INSERT INTO audit_logs (
+    workspace_id, user_id, action, category,
+    resource_type, resource_id, details, severity
+  )
+  VALUES (
+    v_review.workspace_id, p_user_id, 'documents.review.update', 'documents',
+    'document_review', v_review.id, p_audit_details, 'info'
+  );
+
+  RETURN NEXT v_review;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
@@ -0,0 +1,49 @@
+-- =============================================================================
+-- Migration: accept a client-generated id in create_review_with_audit
+-- The upload endpoint now acknowledges with a pre-generated UUID and
+-- defers the insert to a background task, so the RPC must persist the
+-- id the client already returned instead of minting its own.
+-- =============================================================================
+
+-- Signature changes, so drop the old overload first.
+DROP FUNCTION IF EXISTS create_review_with_audit(UUID, TEXT, TEXT, TEXT, UUID);
+
+CREATE OR REPLACE FUNCTION create_review_with_audit(
+    p_id            UUID,
+    p_workspace_id  UUID,
+    p_document_name TEXT,
+    p_document_type TEXT,
+    p_file_url      TEXT,
+    p_user_id       UUID
+)
+RETURNS SETOF document_reviews AS $$
+DECLARE
+  v_review document_reviews;
+BEGIN
+  INSERT INTO document_reviews (
+    id, workspace_id, document_name, document_type, file_url, status, issues
+  )
+  VALUES (
+    COALESCE(p_id, gen_random_uuid()),
+    p_workspace_id, p_document_name, p_document_type, p_file_url,
+    'pending', '[]'::jsonb
+  )
+  RETURNING * INTO v_review;
+
+  INSERT INTO audit_logs (
+    workspace_id, user_id, action, category,
+    resource_type, resource_id, details, severity
+  )
+  VALUES (
+    p_workspace_id, p_user_id, 'documents.upload', 'documents',
+    'document_review', v_review.id,
+    jsonb_build_object(
+      'document_name', p_document_name,
+      'document_type', p_document_type
+    ),
+    'info'
+  );
+
+  RETURN NEXT v_review;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;